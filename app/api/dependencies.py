@@ -1,19 +1,19 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.infra.db.postgres.postgres_config import get_db
 from app.utils.security import decode_token
 from app.infra.db.postgres.repositories.user_repository import UserRepository
 from app.infra.db.postgres.models.user import User
+from app.services.session_tracker import session_tracker
 from typing import Optional
 
 security = HTTPBearer()
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token."""
+def get_token_payload(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """Decode the bearer access token and return its claims."""
     token = credentials.credentials
     
     # Decode token
@@ -33,6 +33,14 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    return payload
+
+def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db),
+    x_device_id: Optional[str] = Header(None)
+) -> User:
+    """Get current authenticated user from JWT token."""
     # Get user
     user_id = payload.get("sub")
     if not user_id:
@@ -42,6 +50,15 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # The device is taken from the token; a header naming another device is rejected
+    device_id = payload.get("device_id")
+    if x_device_id is not None and x_device_id != device_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token was not issued to this device",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     user_repo = UserRepository(db)
     user = user_repo.get_by_id(user_id)
     
@@ -59,6 +76,16 @@ def get_current_user(
             detail=f"Account is {user.status}"
         )
     
+    # Reject tokens of logged-out devices; activity is written behind in batches
+    if device_id:
+        if session_tracker.is_revoked(db, user.user_id, device_id, payload.get("iat")):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session has been logged out",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        session_tracker.record_activity(user.user_id, device_id)
+    
     return user
 
 def get_current_active_user(
@@ -66,3 +93,15 @@ def get_current_active_user(
 ) -> User:
     """Get current active user."""
     return current_user
+
+
+def require_roles(*roles: str):
+    """Dependency factory that only admits active users with one of the given roles."""
+    def check_role(current_user: User = Depends(get_current_active_user)) -> User:
+        if current_user.role not in roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions"
+            )
+        return current_user
+    return check_role
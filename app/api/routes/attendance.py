@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from uuid import UUID
+from app.infra.db.postgres.postgres_config import get_db
+from app.services.attendance_service import AttendanceService
+from app.api.schemas.attendance_schemas import (
+    BulkAttendanceRequest,
+    BulkAttendanceResponse,
+    AttendanceTodayResponse
+)
+from app.api.schemas.common_schemas import CommonResponse
+from app.api.dependencies import require_roles
+from app.infra.db.postgres.models.user import User
+
+router = APIRouter(prefix="/attendance", tags=["Attendance"])
+
+ATTENDANCE_ROLES = ("admin", "depot_manager", "supervisor")
+
+@router.post("/bulk", response_model=CommonResponse[BulkAttendanceResponse])
+async def mark_attendance_bulk(
+    request: BulkAttendanceRequest,
+    current_user: User = Depends(require_roles(*ATTENDANCE_ROLES)),
+    db: Session = Depends(get_db)
+):
+    """
+    Mark attendance for many staff of one depot in a single upsert.
+    
+    - **depot_id**: Depot the staff belong to
+    - **date**: Attendance date (default: today)
+    - **records**: Staff IDs with status and optional check-in details
+    """
+    attendance_service = AttendanceService(db)
+    result = attendance_service.mark_bulk(request, marked_by=current_user.user_id)
+    
+    return CommonResponse(
+        code=status.HTTP_200_OK,
+        message="Attendance marked successfully",
+        data=result
+    )
+
+@router.get("/today", response_model=CommonResponse[AttendanceTodayResponse])
+async def get_today_attendance(
+    depot_id: UUID,
+    current_user: User = Depends(require_roles(*ATTENDANCE_ROLES)),
+    db: Session = Depends(get_db)
+):
+    """
+    Get today's attendance for a depot.
+    
+    Staff without a mark but with an approved leave are reported as on leave.
+    """
+    attendance_service = AttendanceService(db)
+    result = attendance_service.get_today(depot_id)
+    
+    return CommonResponse(
+        code=status.HTTP_200_OK,
+        message="Attendance retrieved successfully",
+        data=result
+    )
@@ -1,18 +1,22 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Header, Request, Response, status, HTTPException
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from app.infra.db.postgres.postgres_config import get_db
 from app.services.auth_service import AuthService
+from app.services.session_tracker import session_tracker
 from app.api.schemas.auth_schemas import (
     RegisterRequest,
     LoginRequest,
     RefreshTokenRequest,
     LoginResponse,
     TokenResponse,
-    UserResponse
+    UserResponse,
+    SessionResponse
 )
 from app.api.schemas.common_schemas import CommonResponse
-from app.api.dependencies import get_current_active_user
+from app.api.dependencies import get_current_active_user, get_token_payload
 from app.infra.db.postgres.models.user import User
+from app.utils.http_cache import make_weak_etag, is_not_modified, not_modified
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -43,18 +47,21 @@ async def register(
 @router.post("/login", response_model=CommonResponse[LoginResponse])
 async def login(
     request: LoginRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    x_device_id: Optional[str] = Header(None)
 ):
     """
     Login user and get access token.
     
     - **email**: User email
     - **password**: User password
+    - **X-Device-ID** (header, optional): Device identifier used for session tracking
     
-    Returns user information and JWT tokens.
+    Returns user information and JWT tokens. With X-Device-ID the tokens are
+    bound to that device and stop working when it is logged out.
     """
     auth_service = AuthService(db)
-    result = auth_service.login(request)
+    result = auth_service.login(request, device_id=x_device_id)
     
     return CommonResponse(
         code=status.HTTP_200_OK,
@@ -65,17 +72,19 @@ async def login(
 @router.post("/refresh", response_model=CommonResponse[TokenResponse])
 async def refresh_token(
     request: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    x_device_id: Optional[str] = Header(None)
 ):
     """
     Refresh access token using refresh token.
     
     - **refresh_token**: Valid refresh token
     
-    Returns new access and refresh tokens.
+    Returns new access and refresh tokens for the same device. An X-Device-ID
+    header that differs from the token's device is rejected.
     """
     auth_service = AuthService(db)
-    result = auth_service.refresh_token(request.refresh_token)
+    result = auth_service.refresh_token(request.refresh_token, device_id=x_device_id)
     
     return CommonResponse(
         code=status.HTTP_200_OK,
@@ -85,13 +94,25 @@ async def refresh_token(
 
 @router.get("/me", response_model=CommonResponse[UserResponse])
 async def get_current_user_info(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Get current authenticated user information.
     
-    Requires valid access token in Authorization header.
+    Requires valid access token in Authorization header. Responds with
+    304 Not Modified when If-None-Match matches the user's current ETag.
     """
+    # Every change to the user row bumps updated_at, so no need to serialize. The
+    # ETag is weak because the body's timestamp differs on every response.
+    version = f"{current_user.user_id}:{current_user.updated_at.isoformat() if current_user.updated_at else ''}"
+    etag = make_weak_etag(version.encode())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if is_not_modified(request, etag):
+        return not_modified(headers)
+    response.headers.update(headers)
+    
     return CommonResponse(
         code=status.HTTP_200_OK,
         message="User retrieved successfully",
@@ -100,18 +121,67 @@ async def get_current_user_info(
 
 @router.post("/logout", response_model=CommonResponse[dict])
 async def logout(
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db)
 ):
     """
     Logout user (client should discard tokens).
     
-    Requires valid access token in Authorization header.
+    Requires valid access token in Authorization header. When the token was
+    issued to a device, that device's session is ended and its tokens are rejected.
     """
-    # In a production app, you would invalidate the refresh token in the database
-    # For now, we just return success and let the client discard the tokens
+    device_id = payload.get("device_id")
+    if device_id:
+        session_tracker.force_logout(db, current_user.user_id, device_id)
     
     return CommonResponse(
         code=status.HTTP_200_OK,
         message="Logout successful",
         data={"message": "Please discard your tokens"}
     )
+
+
+@router.get("/sessions", response_model=CommonResponse[List[SessionResponse]])
+async def list_sessions(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    List the current user's active device sessions.
+    
+    Requires valid access token in Authorization header.
+    """
+    sessions = session_tracker.active_sessions(db, current_user.user_id)
+    
+    return CommonResponse(
+        code=status.HTTP_200_OK,
+        message="Sessions retrieved successfully",
+        data=[
+            SessionResponse(device_id=device_id, last_activity=last_activity)
+            for device_id, last_activity in sessions.items()
+        ]
+    )
+
+@router.delete("/sessions/{device_id}", response_model=CommonResponse[dict])
+async def force_logout_device(
+    device_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Log out one of the current user's devices.
+    
+    Tokens previously issued to that device are rejected from now on.
+    """
+    if not session_tracker.force_logout(db, current_user.user_id, device_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+    
+    return CommonResponse(
+        code=status.HTTP_200_OK,
+        message="Device logged out successfully",
+        data={"device_id": device_id}
+    )
@@ -0,0 +1,34 @@
+import json
+from functools import lru_cache
+from typing import Tuple
+from fastapi import APIRouter, Request, Response
+from app.config.settings import settings
+from app.utils.http_cache import make_etag, is_not_modified, not_modified
+from app.utils.security import get_jwks
+
+router = APIRouter(tags=["Well-Known"])
+
+@lru_cache(maxsize=1)
+def _jwks_document() -> Tuple[bytes, str]:
+    """Serialized JWKS and its ETag, built once per process."""
+    body = json.dumps(get_jwks(), separators=(",", ":"), sort_keys=True).encode()
+    return body, make_etag(body)
+
+@router.get("/.well-known/jwks.json")
+async def jwks(request: Request):
+    """
+    Public keys for verifying access tokens offline.
+
+    Downstream services should cache this for Cache-Control max-age and
+    select the key by the token's `kid` header.
+    """
+    body, etag = _jwks_document()
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}",
+        "ETag": etag,
+    }
+
+    if is_not_modified(request, etag):
+        return not_modified(headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from typing import List
+from uuid import UUID
+from app.api.dependencies import get_current_active_user
+from app.api.schemas.common_schemas import CommonResponse
+from app.api.schemas.reference_schemas import (
+    DepotResponse,
+    VehicleResponse,
+    RouteResponse,
+    RouteStopResponse,
+    ReferenceCacheStats
+)
+from app.infra.db.postgres.models.user import User
+from app.services.reference_cache import reference_cache, DEPOTS, VEHICLES, ROUTES, ROUTE_STOPS
+from app.utils.http_cache import is_not_modified, not_modified
+
+router = APIRouter(tags=["Reference Data"])
+
+def _cached_response(request: Request, table: str, body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized body, or 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if is_not_modified(request, etag):
+        reference_cache.record_not_modified(table)
+        return not_modified(headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _cached_entry(request: Request, table: str, key: UUID, not_found: str) -> Response:
+    entry = reference_cache.get(table).entries.get(key)
+    if entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+    return _cached_response(request, table, *entry)
+
+@router.get("/depots", response_model=CommonResponse[List[DepotResponse]])
+async def list_depots(request: Request, current_user: User = Depends(get_current_active_user)):
+    """List all depots."""
+    snapshot = reference_cache.get(DEPOTS)
+    return _cached_response(request, DEPOTS, snapshot.body, snapshot.etag)
+
+@router.get("/depots/{depot_id}", response_model=CommonResponse[DepotResponse])
+async def get_depot(depot_id: UUID, request: Request, current_user: User = Depends(get_current_active_user)):
+    """Get depot details."""
+    return _cached_entry(request, DEPOTS, depot_id, "Depot not found")
+
+@router.get("/vehicles", response_model=CommonResponse[List[VehicleResponse]])
+async def list_vehicles(request: Request, current_user: User = Depends(get_current_active_user)):
+    """List all vehicles."""
+    snapshot = reference_cache.get(VEHICLES)
+    return _cached_response(request, VEHICLES, snapshot.body, snapshot.etag)
+
+@router.get("/vehicles/{vehicle_id}", response_model=CommonResponse[VehicleResponse])
+async def get_vehicle(vehicle_id: UUID, request: Request, current_user: User = Depends(get_current_active_user)):
+    """Get vehicle details."""
+    return _cached_entry(request, VEHICLES, vehicle_id, "Vehicle not found")
+
+@router.get("/routes", response_model=CommonResponse[List[RouteResponse]])
+async def list_routes(request: Request, current_user: User = Depends(get_current_active_user)):
+    """List all routes."""
+    snapshot = reference_cache.get(ROUTES)
+    return _cached_response(request, ROUTES, snapshot.body, snapshot.etag)
+
+@router.get("/routes/{route_id}", response_model=CommonResponse[RouteResponse])
+async def get_route(route_id: UUID, request: Request, current_user: User = Depends(get_current_active_user)):
+    """Get route details."""
+    return _cached_entry(request, ROUTES, route_id, "Route not found")
+
+@router.get("/routes/{route_id}/stops", response_model=CommonResponse[List[RouteStopResponse]])
+async def list_route_stops(route_id: UUID, request: Request, current_user: User = Depends(get_current_active_user)):
+    """List the stops of a route in order."""
+    if route_id not in reference_cache.get(ROUTES).entries:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Route not found")
+    snapshot = reference_cache.get(ROUTE_STOPS)
+    entry = snapshot.entries.get(route_id, snapshot.empty_entry)
+    return _cached_response(request, ROUTE_STOPS, *entry)
+
+@router.get("/reference-data/stats", response_model=CommonResponse[ReferenceCacheStats])
+async def reference_cache_stats(current_user: User = Depends(get_current_active_user)):
+    """Reference data cache versions, size and hit rate."""
+    return CommonResponse(
+        code=status.HTTP_200_OK,
+        message="Cache statistics retrieved successfully",
+        data=ReferenceCacheStats(**reference_cache.stats())
+    )
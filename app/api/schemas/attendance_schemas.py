@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import date, datetime
+from uuid import UUID
+from app.infra.db.postgres.models.attendance import AttendanceStatus
+
+# Request schemas
+class AttendanceRecord(BaseModel):
+    """Attendance for one staff member."""
+    staff_id: UUID
+    status: AttendanceStatus = AttendanceStatus.PRESENT
+    check_in_time: Optional[datetime] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    notes: Optional[str] = None
+
+class BulkAttendanceRequest(BaseModel):
+    """Attendance for many staff of one depot on one day."""
+    depot_id: UUID
+    date: Optional[date] = None  # defaults to today
+    records: List[AttendanceRecord] = Field(..., min_length=1, max_length=5000)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "depot_id": "123e4567-e89b-12d3-a456-426614174000",
+                "records": [
+                    {"staff_id": "6f1d3b2a-7c4e-4f5a-9b8c-1d2e3f4a5b6c", "status": "present"},
+                    {"staff_id": "0a9b8c7d-6e5f-4a3b-2c1d-0e9f8a7b6c5d", "status": "late"}
+                ]
+            }
+        }
+
+# Response schemas
+class BulkAttendanceResponse(BaseModel):
+    """Bulk attendance result."""
+    depot_id: UUID
+    date: date
+    marked: int
+
+class AttendanceTodayResponse(BaseModel):
+    """Attendance of a depot for today."""
+    depot_id: UUID
+    date: date
+    total_staff: int
+    counts: Dict[str, int]
+    present: List[UUID]
+    absent: List[UUID]
+    on_leave: List[UUID]
+    late: List[UUID]
+    half_day: List[UUID]
+    unmarked: List[UUID]
@@ -104,3 +104,16 @@ class LoginResponse(BaseModel):
     """Login response with user and tokens."""
     user: UserResponse
     tokens: TokenResponse
+
+class SessionResponse(BaseModel):
+    """Active device session."""
+    device_id: str
+    last_activity: Optional[datetime] = None
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "device_id": "3f1c9a7e-android",
+                "last_activity": "2024-12-11T12:00:00"
+            }
+        }
@@ -0,0 +1,102 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+class DepotResponse(BaseModel):
+    """Depot response."""
+    depot_id: UUID
+    code: str
+    name: str
+    location: str
+    address_line1: str
+    address_line2: Optional[str] = None
+    city: str
+    state: str
+    pincode: str
+    contact_number: str
+    email: Optional[str] = None
+    manager_id: Optional[UUID] = None
+    capacity: int
+    active_vehicles: Optional[int] = None
+    active_staff: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    status: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class VehicleResponse(BaseModel):
+    """Vehicle response."""
+    vehicle_id: UUID
+    registration_number: str
+    vehicle_number: str
+    make: str
+    model: str
+    year: int
+    capacity: int
+    vehicle_type: str
+    fuel_type: str
+    depot_id: Optional[UUID] = None
+    status: Optional[str] = None
+    last_service_date: Optional[date] = None
+    next_service_date: Optional[date] = None
+    mileage: Optional[int] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class RouteResponse(BaseModel):
+    """Route response."""
+    route_id: UUID
+    route_number: str
+    name: str
+    origin: str
+    destination: str
+    distance: float  # kilometers
+    estimated_duration: int  # minutes
+    route_type: Optional[str] = None
+    base_fare: Decimal
+    depot_id: Optional[UUID] = None
+    status: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class RouteStopResponse(BaseModel):
+    """Route stop response."""
+    stop_id: UUID
+    route_id: UUID
+    stop_name: str
+    stop_order: int
+    distance_from_origin: float  # kilometers
+    estimated_arrival_time: int  # minutes from origin
+    fare: Decimal
+    is_boarding: Optional[bool] = None
+    is_dropping: Optional[bool] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    
+    class Config:
+        from_attributes = True
+
+class ReferenceCacheTableStats(BaseModel):
+    """Cache statistics for one reference table."""
+    version: int
+    rows: int
+    size_bytes: int
+    hits: int
+    misses: int
+    not_modified: int
+    loaded_at: Optional[datetime] = None
+
+class ReferenceCacheStats(BaseModel):
+    """Reference data cache statistics."""
+    tables: dict[str, ReferenceCacheTableStats]
+    size_bytes: int
+    hit_rate: float
@@ -1,4 +1,10 @@
 # Import all models here for SQLAlchemy to register them
 from app.infra.db.postgres.models.user import User
+from app.infra.db.postgres.models.user_session import UserSession
+from app.infra.db.postgres.models.depot import Depot
+from app.infra.db.postgres.models.vehicle import Vehicle
+from app.infra.db.postgres.models.route import Route, RouteStop
+from app.infra.db.postgres.models.staff import Staff
+from app.infra.db.postgres.models.attendance import Attendance, LeaveRequest
 
-__all__ = ["User"]
+__all__ = ["User", "UserSession", "Depot", "Vehicle", "Route", "RouteStop", "Staff", "Attendance", "LeaveRequest"]
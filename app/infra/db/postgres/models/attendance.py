@@ -0,0 +1,59 @@
+from sqlalchemy import Column, String, Text, Numeric, Date, DateTime, ForeignKey, UniqueConstraint, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+import enum
+from app.infra.db.postgres.postgres_config import Base, enum_values
+
+class AttendanceStatus(str, enum.Enum):
+    PRESENT = "present"
+    ABSENT = "absent"
+    ON_LEAVE = "on-leave"
+    LATE = "late"
+    HALF_DAY = "half-day"
+
+class LeaveType(str, enum.Enum):
+    SICK = "sick"
+    CASUAL = "casual"
+    EARNED = "earned"
+    UNPAID = "unpaid"
+
+class Attendance(Base):
+    __tablename__ = "busops_attendance_tbl"
+    __table_args__ = (
+        UniqueConstraint("staff_id", "date"),
+    )
+    
+    attendance_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    staff_id = Column(UUID(as_uuid=True), ForeignKey("busops_staff_tbl.staff_id", ondelete="CASCADE"), index=True)
+    date = Column(Date, nullable=False, index=True)
+    status = Column(SQLEnum(AttendanceStatus, name="attendance_status", values_callable=enum_values), default=AttendanceStatus.PRESENT)
+    check_in_time = Column(DateTime, nullable=True)
+    check_out_time = Column(DateTime, nullable=True)
+    latitude = Column(Numeric(10, 8), nullable=True)
+    longitude = Column(Numeric(11, 8), nullable=True)
+    notes = Column(Text, nullable=True)
+    marked_by = Column(UUID(as_uuid=True), ForeignKey("busops_users_tbl.user_id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Attendance {self.staff_id} {self.date}>"
+
+class LeaveRequest(Base):
+    __tablename__ = "busops_leave_requests_tbl"
+    
+    leave_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    staff_id = Column(UUID(as_uuid=True), ForeignKey("busops_staff_tbl.staff_id", ondelete="CASCADE"), index=True)
+    leave_type = Column(SQLEnum(LeaveType, name="leave_type", values_callable=enum_values), nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    reason = Column(Text, nullable=False)
+    status = Column(String(20), default="pending")  # 'pending', 'approved', 'rejected'
+    approved_by = Column(UUID(as_uuid=True), ForeignKey("busops_users_tbl.user_id"), nullable=True)
+    approved_at = Column(DateTime, nullable=True)
+    rejection_reason = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<LeaveRequest {self.staff_id} {self.start_date}..{self.end_date}>"
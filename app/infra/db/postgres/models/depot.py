@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+from app.infra.db.postgres.postgres_config import Base, enum_values
+from app.infra.db.postgres.models.user import UserStatus
+
+class Depot(Base):
+    __tablename__ = "busops_depots_tbl"
+    
+    depot_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    code = Column(String(20), unique=True, nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    location = Column(String(255), nullable=False)
+    address_line1 = Column(String(255), nullable=False)
+    address_line2 = Column(String(255), nullable=True)
+    city = Column(String(100), nullable=False)
+    state = Column(String(100), nullable=False)
+    pincode = Column(String(20), nullable=False)
+    contact_number = Column(String(20), nullable=False)
+    email = Column(String(255), nullable=True)
+    manager_id = Column(UUID(as_uuid=True), ForeignKey("busops_users_tbl.user_id"), nullable=True)
+    capacity = Column(Integer, nullable=False)  # Number of buses it can hold
+    active_vehicles = Column(Integer, default=0)
+    active_staff = Column(Integer, default=0)
+    latitude = Column(Numeric(10, 8), nullable=True)
+    longitude = Column(Numeric(11, 8), nullable=True)
+    status = Column(SQLEnum(UserStatus, name="user_status", values_callable=enum_values), default=UserStatus.ACTIVE)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Depot {self.code}>"
@@ -0,0 +1,52 @@
+from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+import enum
+from app.infra.db.postgres.postgres_config import Base, enum_values
+from app.infra.db.postgres.models.user import UserStatus
+
+class RouteType(str, enum.Enum):
+    CITY = "city"
+    INTERCITY = "intercity"
+    EXPRESS = "express"
+    LOCAL = "local"
+
+class Route(Base):
+    __tablename__ = "busops_routes_tbl"
+    
+    route_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    route_number = Column(String(50), unique=True, nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    origin = Column(String(255), nullable=False)
+    destination = Column(String(255), nullable=False)
+    distance = Column(Numeric(10, 2), nullable=False)  # in kilometers
+    estimated_duration = Column(Integer, nullable=False)  # in minutes
+    route_type = Column(SQLEnum(RouteType, name="route_type", values_callable=enum_values), default=RouteType.CITY)
+    base_fare = Column(Numeric(10, 2), nullable=False)
+    depot_id = Column(UUID(as_uuid=True), ForeignKey("busops_depots_tbl.depot_id"), nullable=True, index=True)
+    status = Column(SQLEnum(UserStatus, name="user_status", values_callable=enum_values), default=UserStatus.ACTIVE)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Route {self.route_number}>"
+
+class RouteStop(Base):
+    __tablename__ = "busops_route_stops_tbl"
+    
+    stop_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    route_id = Column(UUID(as_uuid=True), ForeignKey("busops_routes_tbl.route_id", ondelete="CASCADE"), index=True)
+    stop_name = Column(String(255), nullable=False)
+    stop_order = Column(Integer, nullable=False)
+    distance_from_origin = Column(Numeric(10, 2), nullable=False)  # in kilometers
+    estimated_arrival_time = Column(Integer, nullable=False)  # in minutes from origin
+    fare = Column(Numeric(10, 2), nullable=False)
+    is_boarding = Column(Boolean, default=True)
+    is_dropping = Column(Boolean, default=True)
+    latitude = Column(Numeric(10, 8), nullable=True)
+    longitude = Column(Numeric(11, 8), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<RouteStop {self.stop_name}>"
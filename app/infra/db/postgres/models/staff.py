@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+from app.infra.db.postgres.postgres_config import Base
+
+class Staff(Base):
+    __tablename__ = "busops_staff_tbl"
+    
+    staff_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("busops_users_tbl.user_id", ondelete="CASCADE"), index=True)
+    employee_id = Column(String(50), unique=True, nullable=False, index=True)
+    depot_id = Column(UUID(as_uuid=True), ForeignKey("busops_depots_tbl.depot_id"), nullable=True, index=True)
+    license_number = Column(String(50), nullable=True)
+    license_type = Column(String(50), nullable=True)  # 'heavy', 'light', 'transport'
+    license_expiry = Column(Date, nullable=True)
+    date_of_joining = Column(Date, nullable=False)
+    shift = Column(String(20), nullable=True)  # 'morning', 'afternoon', 'night'
+    address_line1 = Column(String(255), nullable=True)
+    address_line2 = Column(String(255), nullable=True)
+    city = Column(String(100), nullable=True)
+    state = Column(String(100), nullable=True)
+    pincode = Column(String(20), nullable=True)
+    emergency_contact_name = Column(String(100), nullable=True)
+    emergency_contact_phone = Column(String(20), nullable=True)
+    blood_group = Column(String(5), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Staff {self.employee_id}>"
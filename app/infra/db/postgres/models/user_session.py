@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+from app.infra.db.postgres.postgres_config import Base
+
+class UserSession(Base):
+    __tablename__ = "busops_user_sessions_tbl"
+    __table_args__ = (
+        UniqueConstraint("user_id", "device_id"),
+    )
+    
+    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("busops_users_tbl.user_id", ondelete="CASCADE"), index=True)
+    device_id = Column(String(255), nullable=False, index=True)
+    device_name = Column(String(255), nullable=True)
+    device_type = Column(String(50), nullable=True)  # 'mobile', 'web', 'tablet'
+    platform = Column(String(50), nullable=True)  # 'ios', 'android', 'web'
+    is_active = Column(Boolean, default=True, index=True)
+    last_activity = Column(DateTime, default=datetime.utcnow)
+    # Tokens for this device issued before this time are rejected
+    tokens_valid_after = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<UserSession {self.user_id}:{self.device_id}>"
@@ -0,0 +1,55 @@
+from sqlalchemy import Column, String, Integer, Date, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+import enum
+from app.infra.db.postgres.postgres_config import Base, enum_values
+
+class VehicleStatus(str, enum.Enum):
+    AVAILABLE = "available"
+    IN_SERVICE = "in-service"
+    MAINTENANCE = "maintenance"
+    BREAKDOWN = "breakdown"
+    RETIRED = "retired"
+
+class VehicleType(str, enum.Enum):
+    ORDINARY = "ordinary"
+    SEMI_LUXURY = "semi-luxury"
+    LUXURY = "luxury"
+    AC = "ac"
+    NON_AC = "non-ac"
+    SLEEPER = "sleeper"
+
+class FuelType(str, enum.Enum):
+    DIESEL = "diesel"
+    PETROL = "petrol"
+    CNG = "cng"
+    ELECTRIC = "electric"
+    HYBRID = "hybrid"
+
+class Vehicle(Base):
+    __tablename__ = "busops_vehicles_tbl"
+    
+    vehicle_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    registration_number = Column(String(50), unique=True, nullable=False, index=True)
+    vehicle_number = Column(String(50), unique=True, nullable=False)
+    make = Column(String(100), nullable=False)
+    model = Column(String(100), nullable=False)
+    year = Column(Integer, nullable=False)
+    capacity = Column(Integer, nullable=False)
+    vehicle_type = Column(SQLEnum(VehicleType, name="vehicle_type", values_callable=enum_values), nullable=False)
+    fuel_type = Column(SQLEnum(FuelType, name="fuel_type", values_callable=enum_values), nullable=False)
+    depot_id = Column(UUID(as_uuid=True), ForeignKey("busops_depots_tbl.depot_id"), nullable=True, index=True)
+    status = Column(SQLEnum(VehicleStatus, name="vehicle_status", values_callable=enum_values), default=VehicleStatus.AVAILABLE)
+    last_service_date = Column(Date, nullable=True)
+    next_service_date = Column(Date, nullable=True)
+    mileage = Column(Integer, default=0)  # in kilometers
+    gps_device_id = Column(String(100), nullable=True)
+    insurance_expiry = Column(Date, nullable=True)
+    permit_expiry = Column(Date, nullable=True)
+    fitness_certificate_expiry = Column(Date, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<Vehicle {self.registration_number}>"
@@ -0,0 +1,110 @@
+import select
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+from app.config.settings import settings
+from app.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Receives the payloads seen on a channel, or None to resync everything
+NotificationHandler = Callable[[Optional[Set[str]]], None]
+
+@dataclass
+class Subscription:
+    handler: NotificationHandler
+    resync_interval: Optional[float]
+    last_resync: float = 0.0
+
+class NotificationListener:
+    """
+    One LISTEN connection per process that hands Postgres NOTIFY payloads to
+    in-memory caches on a background thread.
+
+    Handlers are called with None after every (re)connect, since notifications
+    sent while disconnected are lost, and every `resync_interval` seconds if set.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        # Identifies this process in NOTIFY payloads so it can skip its own writes
+        self.origin = uuid.uuid4().hex
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: NotificationHandler,
+        resync_interval: Optional[float] = None
+    ) -> None:
+        """Register a handler for a channel. Call before start()."""
+        self._subscriptions[channel] = Subscription(handler, resync_interval)
+
+    def start(self) -> None:
+        """Start listening in a daemon thread (PostgreSQL only)."""
+        if not self._subscriptions or self._thread is not None:
+            return
+        if not self.url.startswith("postgresql"):
+            logger.info("Change notifications disabled: LISTEN/NOTIFY needs PostgreSQL")
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="notification-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread = None
+
+    def _dispatch(self, channel: str, payloads: Optional[Set[str]]) -> None:
+        subscription = self._subscriptions[channel]
+        if payloads is None:
+            subscription.last_resync = time.time()
+        try:
+            subscription.handler(payloads)
+        except Exception as e:
+            logger.error(f"Notification handler for {channel} failed: {e}")
+
+    def _listen(self) -> None:
+        engine = create_engine(self.url, poolclass=NullPool)
+        while not self._stop.is_set():
+            raw = None
+            try:
+                raw = engine.raw_connection()
+                conn = raw.driver_connection
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    for channel in self._subscriptions:
+                        cursor.execute(f"LISTEN {channel}")
+
+                for channel in self._subscriptions:
+                    self._dispatch(channel, None)
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0) != ([], [], []):
+                        conn.poll()
+                        received: Dict[str, Set[str]] = {}
+                        for notify in conn.notifies:
+                            received.setdefault(notify.channel, set()).add(notify.payload)
+                        conn.notifies.clear()
+                        for channel, payloads in received.items():
+                            if channel in self._subscriptions:
+                                self._dispatch(channel, payloads)
+
+                    now = time.time()
+                    for channel, subscription in self._subscriptions.items():
+                        if subscription.resync_interval and now - subscription.last_resync >= subscription.resync_interval:
+                            self._dispatch(channel, None)
+            except Exception as e:
+                logger.error(f"Notification listener error: {e}")
+                self._stop.wait(5)
+            finally:
+                if raw is not None:
+                    raw.close()
+
+notification_listener = NotificationListener(settings.NOTIFY_DATABASE_URL)
@@ -3,6 +3,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.config.settings import settings
 from app.config.logger import get_logger
+from app.infra.db.postgres.routing import ReplicaSet, RoutingSession
 
 logger = get_logger(__name__)
 
@@ -14,12 +15,37 @@ engine = create_engine(
     max_overflow=20
 )
 
+# Create replica engines for read-only repository methods
+# A short connect timeout keeps a down replica from stalling the lag monitor
+replica_engines = [
+    create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        connect_args={"connect_timeout": settings.REPLICA_CONNECT_TIMEOUT_SECONDS}
+    )
+    for url in settings.DATABASE_REPLICA_URLS
+]
+if replica_engines:
+    RoutingSession.replica_set = ReplicaSet(
+        replica_engines,
+        max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval=settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+        strategy=settings.REPLICA_SELECTION
+    )
+    logger.info(f"Routing reads to {len(replica_engines)} replica(s) ({settings.REPLICA_SELECTION})")
+
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
 
 # Create Base class for models
 Base = declarative_base()
 
+def enum_values(enum_class) -> list:
+    """Persist enum values (e.g. 'in-service') rather than member names."""
+    return [member.value for member in enum_class]
+
 def get_db() -> Session:
     """
     Dependency function to get database session.
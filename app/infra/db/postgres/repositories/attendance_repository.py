@@ -0,0 +1,98 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from app.infra.db.postgres.models.staff import Staff
+from app.infra.db.postgres.models.attendance import Attendance, AttendanceStatus, LeaveRequest
+from uuid import UUID
+
+class AttendanceRepository:
+    """
+    Repository for attendance and leave database operations.
+    
+    Not @read_only: the attendance roster is rebuilt right after a NOTIFY from
+    the primary, which a replica may not have replayed yet.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def list_staff(self) -> List[Tuple[UUID, Optional[UUID]]]:
+        """Get (staff_id, depot_id) for all staff, in a stable order per depot."""
+        return (
+            self.db.query(Staff.staff_id, Staff.depot_id)
+            .order_by(Staff.depot_id, Staff.employee_id)
+            .all()
+        )
+    
+    def get_statuses(self, day: date) -> List[Tuple[UUID, AttendanceStatus]]:
+        """Get (staff_id, status) for every attendance record on a day."""
+        return (
+            self.db.query(Attendance.staff_id, Attendance.status)
+            .filter(Attendance.date == day)
+            .all()
+        )
+    
+    def get_staff_on_leave(self, day: date) -> List[UUID]:
+        """Get staff with an approved leave covering a day."""
+        rows = (
+            self.db.query(LeaveRequest.staff_id)
+            .filter(
+                LeaveRequest.status == "approved",
+                LeaveRequest.start_date <= day,
+                LeaveRequest.end_date >= day
+            )
+            .all()
+        )
+        return [row.staff_id for row in rows]
+    
+    def bulk_upsert(
+        self,
+        day: date,
+        records: List[Dict],
+        marked_by: UUID,
+        notify_origin: Optional[str] = None
+    ) -> int:
+        """
+        Insert or update attendance for many staff on one day in a single statement.
+        
+        Each record holds staff_id and status, plus optional check_in_time,
+        latitude, longitude and notes. Staff IDs must be unique within records.
+        `notify_origin` is appended to the change notification so the caller's
+        process can recognize and skip it.
+        """
+        if not records:
+            return 0
+        
+        if notify_origin:
+            # Transaction-local; read by notify_attendance_change()
+            self.db.execute(select(func.set_config("busops.notify_origin", notify_origin, True)))
+        
+        stmt = insert(Attendance).values([
+            {
+                "staff_id": record["staff_id"],
+                "date": day,
+                "status": record["status"],
+                "check_in_time": record.get("check_in_time"),
+                "latitude": record.get("latitude"),
+                "longitude": record.get("longitude"),
+                "notes": record.get("notes"),
+                "marked_by": marked_by,
+            }
+            for record in records
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Attendance.staff_id, Attendance.date],
+            set_={
+                "status": stmt.excluded.status,
+                "check_in_time": func.coalesce(stmt.excluded.check_in_time, Attendance.check_in_time),
+                "latitude": func.coalesce(stmt.excluded.latitude, Attendance.latitude),
+                "longitude": func.coalesce(stmt.excluded.longitude, Attendance.longitude),
+                "notes": func.coalesce(stmt.excluded.notes, Attendance.notes),
+                "marked_by": stmt.excluded.marked_by,
+            }
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
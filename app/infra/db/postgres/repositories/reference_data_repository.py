@@ -0,0 +1,32 @@
+from sqlalchemy.orm import Session
+from typing import List
+from app.infra.db.postgres.models.depot import Depot
+from app.infra.db.postgres.models.vehicle import Vehicle
+from app.infra.db.postgres.models.route import Route, RouteStop
+
+class ReferenceDataRepository:
+    """
+    Repository for reference data (depots, vehicles, routes, route stops).
+    
+    Not @read_only: the cache reloads right after a NOTIFY from the primary,
+    which a replica may not have replayed yet.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def list_depots(self) -> List[Depot]:
+        """Get all depots ordered by code."""
+        return self.db.query(Depot).order_by(Depot.code).all()
+    
+    def list_vehicles(self) -> List[Vehicle]:
+        """Get all vehicles ordered by vehicle number."""
+        return self.db.query(Vehicle).order_by(Vehicle.vehicle_number).all()
+    
+    def list_routes(self) -> List[Route]:
+        """Get all routes ordered by route number."""
+        return self.db.query(Route).order_by(Route.route_number).all()
+    
+    def list_route_stops(self) -> List[RouteStop]:
+        """Get all route stops ordered by route and stop order."""
+        return self.db.query(RouteStop).order_by(RouteStop.route_id, RouteStop.stop_order).all()
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from app.infra.db.postgres.models.user import User, UserRole, UserStatus
 from app.utils.security import get_password_hash
+from app.infra.db.postgres.routing import read_only
 from uuid import UUID
 
 class UserRepository:
@@ -10,14 +11,19 @@ class UserRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    @read_only
     def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
+        if isinstance(user_id, str):
+            user_id = UUID(user_id)
         return self.db.query(User).filter(User.user_id == user_id).first()
     
+    @read_only
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         return self.db.query(User).filter(User.email == email).first()
     
+    @read_only
     def get_by_phone(self, phone: str) -> Optional[User]:
         """Get user by phone."""
         return self.db.query(User).filter(User.phone == phone).first()
@@ -0,0 +1,112 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from app.infra.db.postgres.models.user_session import UserSession
+from uuid import UUID
+
+class UserSessionRepository:
+    """Repository for UserSession database operations."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_active_by_user(self, user_id: UUID) -> List[UserSession]:
+        """
+        Get all active sessions for a user.
+        
+        Read from the primary: a lagging replica would list a device that was
+        just logged out.
+        """
+        return (
+            self.db.query(UserSession)
+            .filter(UserSession.user_id == user_id, UserSession.is_active.is_(True))
+            .all()
+        )
+    
+    def get_session(self, user_id: UUID, device_id: str) -> Optional[UserSession]:
+        """
+        Get the session row of one device.
+        
+        Read from the primary: it decides whether the device's tokens are
+        still accepted, right after a logout a replica may not have replayed.
+        """
+        return (
+            self.db.query(UserSession)
+            .filter(UserSession.user_id == user_id, UserSession.device_id == device_id)
+            .first()
+        )
+    
+    def upsert_activity(
+        self,
+        activity: Dict[Tuple[UUID, str], datetime]
+    ) -> List[Tuple[UUID, str, bool, Optional[datetime]]]:
+        """
+        Write last_activity for many (user_id, device_id) pairs in one statement.
+        
+        Existing rows keep their is_active flag so late activity never revives
+        a logged-out device. Returns (user_id, device_id, is_active,
+        tokens_valid_after) per row.
+        """
+        if not activity:
+            return []
+        
+        stmt = insert(UserSession).values([
+            {"user_id": user_id, "device_id": device_id, "last_activity": last_activity}
+            for (user_id, device_id), last_activity in activity.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserSession.user_id, UserSession.device_id],
+            set_={"last_activity": stmt.excluded.last_activity}
+        ).returning(
+            UserSession.user_id,
+            UserSession.device_id,
+            UserSession.is_active,
+            UserSession.tokens_valid_after
+        )
+        
+        rows = self.db.execute(stmt).all()
+        self.db.commit()
+        return [(row.user_id, row.device_id, row.is_active, row.tokens_valid_after) for row in rows]
+    
+    def activate(self, user_id: UUID, device_id: str, valid_after: datetime) -> None:
+        """Create or re-activate the session for a device, rejecting its tokens issued before `valid_after`."""
+        now = datetime.utcnow()
+        stmt = insert(UserSession).values(
+            user_id=user_id,
+            device_id=device_id,
+            is_active=True,
+            last_activity=now,
+            tokens_valid_after=valid_after
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserSession.user_id, UserSession.device_id],
+            set_={
+                "is_active": True,
+                "last_activity": now,
+                # GREATEST skips NULLs, and never moves the cut-off backwards
+                "tokens_valid_after": func.greatest(
+                    UserSession.tokens_valid_after, stmt.excluded.tokens_valid_after
+                )
+            }
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+    
+    def deactivate(self, user_id: UUID, device_id: str, revoked_at: datetime) -> bool:
+        """Mark the session for a device inactive. Returns False if none was active."""
+        updated = (
+            self.db.query(UserSession)
+            .filter(
+                UserSession.user_id == user_id,
+                UserSession.device_id == device_id,
+                UserSession.is_active.is_(True)
+            )
+            .update(
+                {UserSession.is_active: False, UserSession.tokens_valid_after: revoked_at},
+                synchronize_session=False
+            )
+        )
+        self.db.commit()
+        return updated > 0
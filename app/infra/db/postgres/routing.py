@@ -0,0 +1,155 @@
+import functools
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds of replay lag on a replica; 0 when fully caught up or not a standby
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+class Replica:
+    """A replica engine with its last measured replication lag."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        # Unknown until first measured, so reads stay on the primary until then
+        self.lag: float = float("inf")
+        self.checked_at: float = 0.0
+
+    def refresh_lag(self) -> None:
+        """Measure replication lag; an unreachable replica counts as infinitely behind."""
+        try:
+            with self.engine.connect() as conn:
+                self.lag = float(conn.execute(REPLICA_LAG_QUERY).scalar() or 0)
+        except Exception as e:
+            self.lag = float("inf")
+            logger.error(f"Replica lag check failed for {self.engine.url.host}: {e}")
+        finally:
+            self.checked_at = time.time()
+
+class ReplicaSet:
+    """
+    Selects a replica for reads, skipping any lagging beyond `max_lag`.
+
+    Lag is measured every `check_interval` seconds by a background thread,
+    started on first use, so requests never wait on a replica connection.
+    A replica whose last measurement is older than three intervals (e.g. the
+    check is stuck on it) is skipped as well.
+    """
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag: float,
+        check_interval: float,
+        strategy: str = "round_robin"
+    ):
+        if strategy not in ("round_robin", "least_busy"):
+            raise ValueError(f"Unknown replica selection strategy: {strategy}")
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.strategy = strategy
+        self._counter = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start measuring lag in a daemon thread (idempotent)."""
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._monitor, name="replica-lag-monitor", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._thread_lock:
+            self._stop.set()
+            self._thread = None
+
+    def _monitor(self) -> None:
+        while not self._stop.is_set():
+            for replica in self.replicas:
+                replica.refresh_lag()
+            self._stop.wait(self.check_interval)
+
+    def is_healthy(self, replica: Replica, now: float) -> bool:
+        return replica.lag <= self.max_lag and now - replica.checked_at < 3 * self.check_interval
+
+    def choose(self) -> Optional[Engine]:
+        """Get a healthy replica engine, or None to fall back to the primary."""
+        if self._thread is None:
+            self.start()
+        now = time.time()
+        healthy = [replica for replica in self.replicas if self.is_healthy(replica, now)]
+        if not healthy:
+            return None
+
+        if self.strategy == "least_busy":
+            return min(healthy, key=lambda replica: replica.engine.pool.checkedout()).engine
+        return healthy[next(self._counter) % len(healthy)].engine
+
+class RoutingSession(Session):
+    """
+    Session that sends reads made inside @read_only repository methods to a
+    replica. Once the session has written anything, every later read uses the
+    primary so a request always sees its own writes. Writes are recognized
+    from ORM flushes and insert()/update()/delete() statements, not raw text().
+    Reads inside use_primary() also use the primary.
+    """
+
+    replica_set: Optional[ReplicaSet] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or (clause is not None and getattr(clause, "is_dml", False)):
+            self.info["wrote"] = True
+        elif (
+            self.replica_set is not None
+            and self.info.get("read_only")
+            and not self.info.get("wrote")
+            and not self.info.get("primary")
+        ):
+            # Keep one replica per session so its reads see a consistent snapshot
+            if "replica" not in self.info:
+                self.info["replica"] = self.replica_set.choose()
+            if self.info["replica"] is not None:
+                return self.info["replica"]
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+def read_only(method: Callable) -> Callable:
+    """Mark a repository method as safe to serve from a read replica."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        previous = self.db.info.get("read_only", False)
+        self.db.info["read_only"] = True
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.db.info["read_only"] = previous
+    return wrapper
+
+@contextmanager
+def use_primary(db: Session) -> Iterator[None]:
+    """Serve reads inside the block from the primary, including @read_only methods."""
+    previous = db.info.get("primary", False)
+    db.info["primary"] = True
+    try:
+        yield
+    finally:
+        db.info["primary"] = previous
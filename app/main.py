@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -5,10 +6,16 @@ from app.config.settings import settings
 from app.config.logger import get_logger
 from sqlalchemy import text
 from app.infra.db.postgres.postgres_config import SessionLocal
+from app.infra.db.postgres.routing import RoutingSession
 # Import models to register them with SQLAlchemy
-from app.infra.db.postgres.models import user
+from app.infra.db.postgres.models import user, user_session, depot, vehicle, route, staff, attendance
 # Import API routes
-from app.api.routes import auth
+from app.api.routes import auth, jwks, reference_data, attendance as attendance_routes
+from app.services.session_tracker import session_tracker
+from app.services.reference_cache import reference_cache
+from app.services.attendance_roster import attendance_roster
+from app.infra.db.postgres.notifications import notification_listener
+from app.utils.security import load_keys
 
 APP_TITLE = "BusOps Backend"
 app = FastAPI(title=APP_TITLE, version="1.0.0")
@@ -26,6 +33,41 @@ app.add_middleware(
 
 # Include API routes
 app.include_router(auth.router, prefix="/api/v1")
+app.include_router(reference_data.router, prefix="/api/v1")
+app.include_router(attendance_routes.router, prefix="/api/v1")
+app.include_router(jwks.router)
+
+@app.on_event("startup")
+async def load_signing_keys():
+    """Fail fast on an unsupported ALGORITHM or asymmetric signing without usable keys."""
+    load_keys()
+
+@app.on_event("startup")
+async def start_session_tracker():
+    """Start the background flush of session activity."""
+    app.state.session_flush_task = asyncio.create_task(session_tracker.run())
+
+@app.on_event("shutdown")
+async def stop_session_tracker():
+    """Stop the flush loop and write any remaining session activity."""
+    app.state.session_flush_task.cancel()
+    await asyncio.to_thread(session_tracker.flush_pending)
+
+@app.on_event("startup")
+async def start_change_listeners():
+    """Build in-memory caches and keep them in sync via LISTEN/NOTIFY."""
+    reference_cache.start()
+    await asyncio.to_thread(attendance_roster.start)
+    notification_listener.start()
+
+@app.on_event("shutdown")
+async def stop_change_listeners():
+    notification_listener.stop()
+
+@app.on_event("shutdown")
+async def stop_replica_monitor():
+    if RoutingSession.replica_set is not None:
+        RoutingSession.replica_set.stop()
 
 @app.get("/")
 async def root():
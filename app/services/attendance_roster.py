@@ -0,0 +1,184 @@
+import threading
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+from uuid import UUID
+import pytz
+from app.config.settings import settings
+from app.config.logger import get_logger
+from app.infra.db.postgres.models.attendance import AttendanceStatus
+from app.infra.db.postgres.postgres_config import SessionLocal
+from app.infra.db.postgres.notifications import notification_listener
+from app.infra.db.postgres.repositories.attendance_repository import AttendanceRepository
+
+logger = get_logger(__name__)
+
+# Channel the notify_attendance_change() trigger publishes changed dates on,
+# as "<date>" or "<date>:<origin>" when the writer tagged its transaction
+NOTIFY_CHANNEL = "busops_attendance"
+# Payloads sent when leave requests or staff depots change; affect every loaded day
+LEAVE_CHANGED = "leave"
+STAFF_CHANGED = "staff"
+
+UNMARKED = 0
+STATUS_CODES: Dict[AttendanceStatus, int] = {
+    AttendanceStatus.PRESENT: 1,
+    AttendanceStatus.ABSENT: 2,
+    AttendanceStatus.ON_LEAVE: 3,
+    AttendanceStatus.LATE: 4,
+    AttendanceStatus.HALF_DAY: 5,
+}
+STATUS_NAMES: Dict[int, str] = {
+    UNMARKED: "unmarked",
+    **{code: status.value for status, code in STATUS_CODES.items()},
+}
+
+class DepotRoster:
+    """
+    Attendance of one depot on one day: one status byte per staff index.
+
+    Marked attendance wins; otherwise staff on approved leave count as
+    on-leave and the rest as unmarked.
+    """
+
+    def __init__(self, staff_ids: List[UUID], statuses: bytearray):
+        self.staff_ids = staff_ids
+        self.index: Mapping[UUID, int] = {staff_id: i for i, staff_id in enumerate(staff_ids)}
+        self.statuses = statuses
+        self._summary: Optional[dict] = None
+        # Bumped by every mark so a summary computed meanwhile is not cached
+        self._changes = 0
+
+    def mark(self, staff_id: UUID, status: AttendanceStatus) -> bool:
+        """Set a staff member's status. Returns False if they are not in this depot."""
+        i = self.index.get(staff_id)
+        if i is None:
+            return False
+        self.statuses[i] = STATUS_CODES[status]
+        self._changes += 1
+        self._summary = None
+        return True
+
+    def summary(self) -> dict:
+        """Counts and staff IDs per status, recomputed only after a change."""
+        summary = self._summary
+        if summary is None:
+            changes = self._changes
+            statuses = bytes(self.statuses)
+            staff = {name: [] for name in STATUS_NAMES.values()}
+            for i, code in enumerate(statuses):
+                staff[STATUS_NAMES[code]].append(self.staff_ids[i])
+            summary = {
+                "total_staff": len(statuses),
+                "counts": {name: statuses.count(code) for code, name in STATUS_NAMES.items()},
+                "staff": staff,
+            }
+            if changes == self._changes:
+                self._summary = summary
+        return summary
+
+class AttendanceRoster:
+    """
+    In-memory attendance for recent days, keyed by day and depot.
+
+    Days are built from busops_staff_tbl, busops_attendance_tbl and approved
+    busops_leave_requests_tbl rows. Bulk marking updates the loaded day in
+    place. Other workers rebuild it when the attendance trigger notifies them;
+    the writing worker ignores the notification its own write caused. Rebuilds
+    and in-place updates are serialized by `_load_lock`, so a rebuild that read
+    the database before a mark committed cannot replace the marked roster
+    after the mark was applied.
+    """
+
+    def __init__(self, timezone: str, max_days: int = 7):
+        self.timezone = pytz.timezone(timezone)
+        self.max_days = max_days
+        self._days: Dict[date, Dict[Optional[UUID], DepotRoster]] = {}
+        # Reentrant: apply() holds it while falling back to load_day()
+        self._load_lock = threading.RLock()
+
+    def today(self) -> date:
+        return datetime.now(self.timezone).date()
+
+    def get(self, depot_id: UUID, day: date) -> DepotRoster:
+        """Get a depot's roster for a day, loading the day on first use."""
+        depots = self._days.get(day)
+        if depots is None:
+            depots = self.load_day(day)
+        return depots.get(depot_id) or DepotRoster([], bytearray())
+
+    def load_day(self, day: date) -> Dict[Optional[UUID], DepotRoster]:
+        """
+        Rebuild every depot's roster for a day from the database.
+
+        Only the `max_days` most recent days stay loaded; an older day is
+        returned without being kept.
+        """
+        with self._load_lock:
+            db = SessionLocal()
+            try:
+                repo = AttendanceRepository(db)
+                staff = repo.list_staff()
+                marked = {staff_id: STATUS_CODES[status] for staff_id, status in repo.get_statuses(day)}
+                on_leave = set(repo.get_staff_on_leave(day))
+            finally:
+                db.close()
+
+            staff_by_depot: Dict[Optional[UUID], List[UUID]] = {}
+            for staff_id, depot_id in staff:
+                staff_by_depot.setdefault(depot_id, []).append(staff_id)
+
+            on_leave_code = STATUS_CODES[AttendanceStatus.ON_LEAVE]
+            depots = {}
+            for depot_id, staff_ids in staff_by_depot.items():
+                statuses = bytearray(
+                    marked.get(staff_id, on_leave_code if staff_id in on_leave else UNMARKED)
+                    for staff_id in staff_ids
+                )
+                depots[depot_id] = DepotRoster(staff_ids, statuses)
+
+            self._days[day] = depots
+            # Keep only the most recent days
+            for old_day in sorted(self._days)[:-self.max_days]:
+                del self._days[old_day]
+            logger.info(f"Loaded attendance for {day} ({len(staff)} staff, {len(depots)} depots)")
+            return depots
+
+    def apply(self, depot_id: UUID, day: date, statuses: Mapping[UUID, AttendanceStatus]) -> None:
+        """Reflect a committed bulk mark in the loaded roster."""
+        with self._load_lock:
+            depots = self._days.get(day)
+            if depots is None:
+                return
+            roster = depots.get(depot_id)
+            if roster is None or not all(roster.mark(staff_id, status) for staff_id, status in statuses.items()):
+                # Staff added or moved since the day was loaded
+                self.load_day(day)
+
+    def start(self) -> None:
+        """Build today's roster and rebuild days when their data changes."""
+        notification_listener.subscribe(NOTIFY_CHANNEL, self._on_notify)
+        try:
+            self.load_day(self.today())
+        except Exception as e:
+            logger.error(f"Failed to load today's attendance: {e}")
+
+    def _on_notify(self, changed: Optional[Set[str]]) -> None:
+        loaded = set(self._days)
+        if changed is None or LEAVE_CHANGED in changed or STAFF_CHANGED in changed:
+            days: Iterable[date] = loaded | {self.today()}
+        else:
+            days = set()
+            for payload in changed:
+                day, _, origin = payload.partition(":")
+                # Our own bulk marks were already applied in place
+                if origin != notification_listener.origin:
+                    days.add(date.fromisoformat(day))
+            days &= loaded
+        for day in sorted(days):
+            self.load_day(day)
+
+# Every date bulk marking accepts stays loaded
+attendance_roster = AttendanceRoster(
+    timezone=settings.TIMEZONE,
+    max_days=settings.ATTENDANCE_MAX_BACKDATE_DAYS + 1
+)
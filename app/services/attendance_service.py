@@ -0,0 +1,75 @@
+from sqlalchemy.orm import Session
+from datetime import timedelta
+from uuid import UUID
+from app.infra.db.postgres.repositories.attendance_repository import AttendanceRepository
+from app.api.schemas.attendance_schemas import BulkAttendanceRequest, BulkAttendanceResponse, AttendanceTodayResponse
+from app.services.attendance_roster import attendance_roster
+from app.infra.db.postgres.notifications import notification_listener
+from app.config.settings import settings
+from fastapi import HTTPException, status
+
+class AttendanceService:
+    """Service for attendance operations."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.attendance_repo = AttendanceRepository(db)
+    
+    def mark_bulk(self, request: BulkAttendanceRequest, marked_by: UUID) -> BulkAttendanceResponse:
+        """Mark attendance for many staff of a depot in one statement."""
+        today = attendance_roster.today()
+        day = request.date or today
+        if day > today or day < today - timedelta(days=settings.ATTENDANCE_MAX_BACKDATE_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Attendance can only be marked for today and the previous {settings.ATTENDANCE_MAX_BACKDATE_DAYS} days"
+            )
+        
+        # One record per staff member; the last one wins
+        records = {record.staff_id: record for record in request.records}
+        
+        # Validate against the in-memory roster; reload once in case staff were just added
+        roster = attendance_roster.get(request.depot_id, day)
+        unknown = [staff_id for staff_id in records if staff_id not in roster.index]
+        if unknown:
+            attendance_roster.load_day(day)
+            roster = attendance_roster.get(request.depot_id, day)
+            unknown = [staff_id for staff_id in records if staff_id not in roster.index]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Staff not found in depot: {', '.join(str(staff_id) for staff_id in unknown)}"
+            )
+        
+        self.attendance_repo.bulk_upsert(
+            day,
+            [record.model_dump() for record in records.values()],
+            marked_by,
+            notify_origin=notification_listener.origin
+        )
+        attendance_roster.apply(
+            request.depot_id,
+            day,
+            {staff_id: record.status for staff_id, record in records.items()}
+        )
+        
+        return BulkAttendanceResponse(depot_id=request.depot_id, date=day, marked=len(records))
+    
+    def get_today(self, depot_id: UUID) -> AttendanceTodayResponse:
+        """Get who is present, absent or on leave today, served from memory."""
+        day = attendance_roster.today()
+        summary = attendance_roster.get(depot_id, day).summary()
+        staff = summary["staff"]
+        
+        return AttendanceTodayResponse(
+            depot_id=depot_id,
+            date=day,
+            total_staff=summary["total_staff"],
+            counts=summary["counts"],
+            present=staff["present"],
+            absent=staff["absent"],
+            on_leave=staff["on-leave"],
+            late=staff["late"],
+            half_day=staff["half-day"],
+            unmarked=staff["unmarked"]
+        )
@@ -1,9 +1,13 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import timedelta
+from typing import Optional
 from app.infra.db.postgres.repositories.user_repository import UserRepository
-from app.utils.security import verify_password, create_access_token, create_refresh_token, decode_token
+from app.infra.db.postgres.routing import use_primary
+from app.utils.security import verify_password, create_access_token, create_refresh_token, decode_token, issued_at
 from app.api.schemas.auth_schemas import RegisterRequest, LoginRequest, TokenResponse, UserResponse, LoginResponse
 from app.config.settings import settings
+from app.services.session_tracker import session_tracker
 from fastapi import HTTPException, status
 
 class AuthService:
@@ -15,32 +19,42 @@ class AuthService:
     
     def register(self, request: RegisterRequest) -> LoginResponse:
         """Register a new user."""
-        # Check if email already exists
-        existing_user = self.user_repo.get_by_email(request.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+        # Duplicate checks read the primary; a lagging replica may not have a just-registered user
+        with use_primary(self.db):
+            # Check if email already exists
+            existing_user = self.user_repo.get_by_email(request.email)
+            if existing_user:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered"
+                )
+            
+            # Check if phone already exists
+            existing_phone = self.user_repo.get_by_phone(request.phone)
+            if existing_phone:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Phone number already registered"
+                )
         
-        # Check if phone already exists
-        existing_phone = self.user_repo.get_by_phone(request.phone)
-        if existing_phone:
+        # Create user
+        try:
+            user = self.user_repo.create(
+                email=request.email,
+                phone=request.phone,
+                password=request.password,
+                first_name=request.first_name,
+                last_name=request.last_name,
+                role=request.role
+            )
+        except IntegrityError:
+            # A concurrent registration took the email or phone after the checks above
+            self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Phone number already registered"
+                detail="Email or phone number already registered"
             )
         
-        # Create user
-        user = self.user_repo.create(
-            email=request.email,
-            phone=request.phone,
-            password=request.password,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            role=request.role
-        )
-        
         # Generate tokens
         tokens = self._generate_tokens(str(user.user_id), user.email)
         
@@ -50,8 +64,8 @@ class AuthService:
             tokens=tokens
         )
     
-    def login(self, request: LoginRequest) -> LoginResponse:
-        """Login user."""
+    def login(self, request: LoginRequest, device_id: Optional[str] = None) -> LoginResponse:
+        """Login user, starting a tracked session when a device ID is given."""
         # Get user by email
         user = self.user_repo.get_by_email(request.email)
         if not user:
@@ -74,8 +88,11 @@ class AuthService:
                 detail=f"Account is {user.status}"
             )
         
-        # Generate tokens
-        tokens = self._generate_tokens(str(user.user_id), user.email)
+        # Generate tokens, bound to the device when one is given
+        tokens_issued_at = issued_at()
+        tokens = self._generate_tokens(str(user.user_id), user.email, device_id, tokens_issued_at)
+        if device_id:
+            session_tracker.start_session(self.db, user.user_id, device_id, tokens_issued_at)
         
         # Return response
         return LoginResponse(
@@ -83,7 +100,7 @@ class AuthService:
             tokens=tokens
         )
     
-    def refresh_token(self, refresh_token: str) -> TokenResponse:
+    def refresh_token(self, refresh_token: str, device_id: Optional[str] = None) -> TokenResponse:
         """Refresh access token."""
         # Decode refresh token
         payload = decode_token(refresh_token)
@@ -109,22 +126,50 @@ class AuthService:
                 detail="User not found"
             )
         
-        # Generate new tokens
-        return self._generate_tokens(str(user.user_id), user.email)
+        # The token's device claim, not the header, decides which session it belongs to
+        token_device_id = payload.get("device_id")
+        if device_id is not None and device_id != token_device_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token was not issued to this device"
+            )
+        
+        # Check the device has not been logged out since the token was issued. Refreshes
+        # are rare, so the cut-off is always read from the database rather than memory.
+        if token_device_id and session_tracker.is_revoked(
+            self.db, user.user_id, token_device_id, payload.get("iat"), refresh=True
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session has been logged out"
+            )
+        
+        # Generate new tokens for the same device
+        return self._generate_tokens(str(user.user_id), user.email, token_device_id)
     
-    def _generate_tokens(self, user_id: str, email: str) -> TokenResponse:
+    def _generate_tokens(
+        self,
+        user_id: str,
+        email: str,
+        device_id: Optional[str] = None,
+        iat: Optional[float] = None
+    ) -> TokenResponse:
         """Generate access and refresh tokens."""
+        claims = {"sub": user_id, "email": email, "iat": iat or issued_at()}
+        if device_id:
+            claims["device_id"] = device_id
+        
         # Create access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user_id, "email": email},
+            data=claims,
             expires_delta=access_token_expires
         )
         
         # Create refresh token
         refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         refresh_token = create_refresh_token(
-            data={"sub": user_id, "email": email},
+            data=claims,
             expires_delta=refresh_token_expires
         )
         
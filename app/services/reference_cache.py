@@ -0,0 +1,224 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type
+from types import MappingProxyType
+from uuid import UUID
+from pydantic import BaseModel, TypeAdapter
+from app.api.schemas.common_schemas import CommonResponse
+from app.api.schemas.reference_schemas import (
+    DepotResponse,
+    VehicleResponse,
+    RouteResponse,
+    RouteStopResponse
+)
+from app.config.settings import settings
+from app.config.logger import get_logger
+from app.infra.db.postgres.postgres_config import SessionLocal
+from app.infra.db.postgres.notifications import notification_listener
+from app.infra.db.postgres.repositories.reference_data_repository import ReferenceDataRepository
+from app.utils.http_cache import make_weak_etag
+
+logger = get_logger(__name__)
+
+# Channel the notify_reference_data_change() trigger publishes table names on
+NOTIFY_CHANNEL = "busops_reference_data"
+
+DEPOTS = "busops_depots_tbl"
+VEHICLES = "busops_vehicles_tbl"
+ROUTES = "busops_routes_tbl"
+ROUTE_STOPS = "busops_route_stops_tbl"
+
+@dataclass(frozen=True)
+class ReferenceTable:
+    """How one reference table is loaded and keyed."""
+    label: str
+    load: Callable[[ReferenceDataRepository], list]
+    schema: Type[BaseModel]
+    key: str
+    # Entries hold a list per key (e.g. stops per route) instead of one item
+    grouped: bool = False
+
+TABLES: Dict[str, ReferenceTable] = {
+    DEPOTS: ReferenceTable("Depots", ReferenceDataRepository.list_depots, DepotResponse, "depot_id"),
+    VEHICLES: ReferenceTable("Vehicles", ReferenceDataRepository.list_vehicles, VehicleResponse, "vehicle_id"),
+    ROUTES: ReferenceTable("Routes", ReferenceDataRepository.list_routes, RouteResponse, "route_id"),
+    ROUTE_STOPS: ReferenceTable(
+        "Route stops", ReferenceDataRepository.list_route_stops, RouteStopResponse, "route_id", grouped=True
+    ),
+}
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable, pre-serialized copy of a reference table."""
+    version: int
+    body: bytes
+    etag: str
+    # key -> (body, etag) for single-item (or per-group) responses
+    entries: Mapping[UUID, Tuple[bytes, str]]
+    rows: int
+    size_bytes: int
+    loaded_at: datetime
+    # (body, etag) for a key with no rows in a grouped table, e.g. a route without stops
+    empty_entry: Optional[Tuple[bytes, str]] = None
+
+@dataclass
+class TableStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+def _serialize(message: str, data, data_type, loaded_at: datetime) -> Tuple[bytes, str]:
+    """
+    Build a CommonResponse body and a weak ETag over its data payload.
+
+    The body's timestamp changes on every reload, so the ETag is weak: an
+    unchanged table keeps its ETag and clients keep getting 304s.
+    """
+    adapter = TypeAdapter(data_type)
+    etag = make_weak_etag(adapter.dump_json(data))
+    body = CommonResponse[data_type](
+        code=200,
+        message=message,
+        data=data,
+        timestamp=loaded_at
+    ).model_dump_json().encode()
+    return body, etag
+
+def build_snapshot(table: ReferenceTable, rows: list, version: int) -> Snapshot:
+    """Serialize table rows into a snapshot with list and per-key bodies."""
+    loaded_at = datetime.utcnow()
+    items = [table.schema.model_validate(row) for row in rows]
+    body, etag = _serialize(f"{table.label} retrieved successfully", items, List[table.schema], loaded_at)
+
+    entries = {}
+    empty_entry = None
+    if table.grouped:
+        empty_entry = _serialize(f"{table.label} retrieved successfully", [], List[table.schema], loaded_at)
+        groups: Dict[UUID, list] = {}
+        for item in items:
+            groups.setdefault(getattr(item, table.key), []).append(item)
+        for key, group in groups.items():
+            entries[key] = _serialize(f"{table.label} retrieved successfully", group, List[table.schema], loaded_at)
+    else:
+        for item in items:
+            entries[getattr(item, table.key)] = _serialize(
+                f"{table.label[:-1]} retrieved successfully", item, table.schema, loaded_at
+            )
+
+    size_bytes = len(body) + sum(len(entry_body) for entry_body, _ in entries.values())
+    return Snapshot(
+        version=version,
+        body=body,
+        etag=etag,
+        entries=MappingProxyType(entries),
+        rows=len(items),
+        size_bytes=size_bytes,
+        loaded_at=loaded_at,
+        empty_entry=empty_entry
+    )
+
+class ReferenceDataCache:
+    """
+    In-memory cache of depots, vehicles, routes and route stops.
+
+    Each table is held as an immutable Snapshot that requests read without
+    locking. A LISTEN connection receives the table name whenever a write
+    commits (see notify_reference_data_change() in scripts/script.sql), and the
+    table is reloaded into a new snapshot with the next version number.
+    Call start() before notification_listener.start().
+
+    Snapshots older than `max_age` are reloaded on access as well, so the
+    cache still refreshes where LISTEN is unavailable (non-PostgreSQL URLs,
+    transaction poolers, serverless deployments).
+    """
+
+    def __init__(self, max_age: int):
+        self.max_age = max_age
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._stats: Dict[str, TableStats] = {name: TableStats() for name in TABLES}
+        self._load_lock = threading.Lock()
+
+    def get(self, name: str) -> Snapshot:
+        """Get the current snapshot of a table, loading it on first use or once expired."""
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None and not self._expired(snapshot):
+            self._stats[name].hits += 1
+            return snapshot
+        self._stats[name].misses += 1
+        if snapshot is None:
+            self.reload([name])
+        else:
+            self._reload_expired(name)
+        return self._snapshots[name]
+
+    def record_not_modified(self, name: str) -> None:
+        self._stats[name].not_modified += 1
+
+    def reload(self, names: Iterable[str]) -> None:
+        """Load tables from the database and swap in new snapshots."""
+        with self._load_lock:
+            self._load(names)
+
+    def _expired(self, snapshot: Snapshot) -> bool:
+        return (datetime.utcnow() - snapshot.loaded_at).total_seconds() >= self.max_age
+
+    def _reload_expired(self, name: str) -> None:
+        """Reload an expired table; concurrent callers keep the stale snapshot meanwhile."""
+        if not self._load_lock.acquire(blocking=False):
+            return
+        try:
+            if self._expired(self._snapshots[name]):
+                self._load([name])
+        except Exception as e:
+            logger.error(f"Failed to reload expired {name}, serving the previous snapshot: {e}")
+        finally:
+            self._load_lock.release()
+
+    def _load(self, names: Iterable[str]) -> None:
+        """Load tables into new snapshots. Call with _load_lock held."""
+        db = SessionLocal()
+        try:
+            repo = ReferenceDataRepository(db)
+            for name in names:
+                table = TABLES[name]
+                previous = self._snapshots.get(name)
+                version = previous.version + 1 if previous else 1
+                self._snapshots[name] = build_snapshot(table, table.load(repo), version)
+                logger.info(f"Loaded {name} v{version} ({self._snapshots[name].rows} rows)")
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        """Version, size and hit counters per table plus the overall hit rate."""
+        tables = {}
+        for name, counters in self._stats.items():
+            snapshot = self._snapshots.get(name)
+            tables[name] = {
+                "version": snapshot.version if snapshot else 0,
+                "rows": snapshot.rows if snapshot else 0,
+                "size_bytes": snapshot.size_bytes if snapshot else 0,
+                "hits": counters.hits,
+                "misses": counters.misses,
+                "not_modified": counters.not_modified,
+                "loaded_at": snapshot.loaded_at if snapshot else None,
+            }
+        hits = sum(counters.hits for counters in self._stats.values())
+        lookups = hits + sum(counters.misses for counters in self._stats.values())
+        return {
+            "tables": tables,
+            "size_bytes": sum(table["size_bytes"] for table in tables.values()),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def start(self) -> None:
+        """Reload tables whenever their change notification arrives."""
+        notification_listener.subscribe(NOTIFY_CHANNEL, self._on_notify, resync_interval=self.max_age)
+
+    def _on_notify(self, changed: Optional[Set[str]]) -> None:
+        # None means a (re)connect or periodic resync: reload everything
+        names = TABLES if changed is None else [name for name in changed if name in TABLES]
+        if names:
+            self.reload(names)
+
+reference_cache = ReferenceDataCache(max_age=settings.REFERENCE_CACHE_MAX_AGE_SECONDS)
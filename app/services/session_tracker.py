@@ -0,0 +1,225 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.config.settings import settings
+from app.config.logger import get_logger
+from app.infra.db.postgres.postgres_config import SessionLocal
+from app.infra.db.postgres.repositories.user_session_repository import UserSessionRepository
+
+logger = get_logger(__name__)
+
+SessionKey = Tuple[UUID, str]
+
+def _millis(seconds: float) -> int:
+    """Epoch seconds (e.g. a token's iat) as whole milliseconds."""
+    return round(seconds * 1000)
+
+def _datetime_millis(value: datetime) -> int:
+    """Naive UTC datetime as epoch milliseconds."""
+    return _millis(value.replace(tzinfo=timezone.utc).timestamp())
+
+def _millis_datetime(millis: int) -> datetime:
+    """Epoch milliseconds as a naive UTC datetime."""
+    return datetime.fromtimestamp(millis / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+class SessionTracker:
+    """
+    Write-behind tracker for busops_user_sessions_tbl.
+
+    Authenticated requests only touch memory: activity is coalesced per
+    (user_id, device_id) and written by flush() as one batched upsert.
+    Each device has a "not valid before" time, stored in tokens_valid_after:
+    a logout moves it to the logout time and a login to the new tokens' iat,
+    so tokens issued earlier are rejected. Local changes are written through
+    immediately. A device's cut-off is read from the database the first time
+    this process sees the device, and again on every refresh; after that,
+    changes made by other workers arrive with the next flush.
+    """
+
+    def __init__(self, flush_interval: int):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[SessionKey, datetime] = {}
+        # (user_id, device_id) -> epoch milliseconds before which tokens are rejected
+        self._not_before: Dict[SessionKey, int] = {}
+        # (user_id, device_id) -> epoch seconds when its cut-off was last read or set
+        self._known: Dict[SessionKey, float] = {}
+        # user_id -> (epoch seconds when loaded, {device_id: last_activity})
+        self._sessions: Dict[UUID, Tuple[float, Dict[str, datetime]]] = {}
+
+    def is_revoked(
+        self,
+        db: Session,
+        user_id: UUID,
+        device_id: str,
+        issued_at: Optional[float],
+        refresh: bool = False
+    ) -> bool:
+        """
+        Check whether a token issued at `issued_at` predates the device's last logout or login.
+        
+        The cut-off is loaded from the database for devices this process has
+        not seen yet, and always when `refresh` is set (token refreshes), so a
+        logout on another worker or before a restart is never missed.
+        """
+        key = (user_id, device_id)
+        if refresh or key not in self._known:
+            self._load_cut_off(db, key)
+        not_before = self._not_before.get(key)
+        if not_before is None:
+            return False
+        return issued_at is None or _millis(issued_at) < not_before
+
+    def record_activity(self, user_id: UUID, device_id: str) -> None:
+        """Record activity for a device; written to the DB on the next flush."""
+        now = datetime.utcnow()
+        with self._lock:
+            self._pending[(user_id, device_id)] = now
+            cached = self._sessions.get(user_id)
+            if cached:
+                cached[1][device_id] = now
+
+    def active_sessions(self, db: Session, user_id: UUID) -> Dict[str, datetime]:
+        """Get {device_id: last_activity} for the user's active sessions."""
+        cached = self._sessions.get(user_id)
+        if cached and time.time() - cached[0] < self.flush_interval:
+            return dict(cached[1])
+
+        devices = {
+            session.device_id: session.last_activity
+            for session in UserSessionRepository(db).get_active_by_user(user_id)
+        }
+        with self._lock:
+            # Activity not flushed yet is newer than what the DB has
+            for (pending_user, device_id), last_activity in self._pending.items():
+                if pending_user == user_id:
+                    devices[device_id] = last_activity
+            self._sessions[user_id] = (time.time(), devices)
+        return dict(devices)
+
+    def start_session(self, db: Session, user_id: UUID, device_id: str, issued_at: float) -> None:
+        """
+        Activate the session for a device after a successful login.
+        
+        `issued_at` is the iat of the login's tokens; the device's tokens
+        issued before it (including any from before a logout) stay rejected.
+        """
+        valid_after = _millis(issued_at)
+        UserSessionRepository(db).activate(user_id, device_id, _millis_datetime(valid_after))
+        with self._lock:
+            self._advance((user_id, device_id), valid_after)
+            self._known[(user_id, device_id)] = time.time()
+            cached = self._sessions.get(user_id)
+            if cached:
+                cached[1][device_id] = datetime.utcnow()
+
+    def force_logout(self, db: Session, user_id: UUID, device_id: str) -> bool:
+        """Log a device out. Returns False if it had no active session."""
+        # Tokens issued in the same millisecond as the logout are rejected too
+        revoked_at = _millis(time.time()) + 1
+        with self._lock:
+            self._advance((user_id, device_id), revoked_at)
+            self._known[(user_id, device_id)] = time.time()
+            self._pending.pop((user_id, device_id), None)
+            cached = self._sessions.get(user_id)
+            if cached:
+                cached[1].pop(device_id, None)
+        return UserSessionRepository(db).deactivate(user_id, device_id, _millis_datetime(revoked_at))
+
+    def flush(self, db: Session) -> int:
+        """Write all pending activity in one upsert. Returns the number of rows written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            self._prune()
+            return 0
+
+        try:
+            rows = UserSessionRepository(db).upsert_activity(pending)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Session activity flush failed: {e}")
+            with self._lock:
+                # Put the batch back unless newer activity arrived meanwhile
+                for key, last_activity in pending.items():
+                    self._pending.setdefault(key, last_activity)
+            return 0
+
+        # Logouts and logins on other workers show up here as a newer tokens_valid_after
+        now = _millis(time.time())
+        with self._lock:
+            for user_id, device_id, is_active, valid_after in rows:
+                if valid_after is not None:
+                    self._advance((user_id, device_id), _datetime_millis(valid_after))
+                elif not is_active:
+                    # Logged out before tokens_valid_after was recorded
+                    self._advance((user_id, device_id), now)
+                if not is_active:
+                    cached = self._sessions.get(user_id)
+                    if cached:
+                        cached[1].pop(device_id, None)
+        self._prune()
+        return len(rows)
+
+    def flush_pending(self) -> int:
+        """Flush using a dedicated database session."""
+        db = SessionLocal()
+        try:
+            return self.flush(db)
+        finally:
+            db.close()
+
+    async def run(self) -> None:
+        """Flush pending activity every `flush_interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush_pending)
+            except Exception as e:
+                logger.error(f"Session tracker flush loop error: {e}")
+
+    def _load_cut_off(self, db: Session, key: SessionKey) -> None:
+        """Adopt a device's cut-off from busops_user_sessions_tbl."""
+        session = UserSessionRepository(db).get_session(*key)
+        # Rejects every token issued up to now, as a logout would
+        now = _millis(time.time()) + 1
+        with self._lock:
+            if session is None:
+                # Device-bound tokens are only issued after the row is written,
+                # so a missing row means the session (or user) was deleted
+                self._advance(key, now)
+            elif session.tokens_valid_after is not None:
+                self._advance(key, _datetime_millis(session.tokens_valid_after))
+            elif not session.is_active:
+                # Logged out before tokens_valid_after was recorded
+                self._advance(key, now)
+            self._known[key] = time.time()
+
+    def _advance(self, key: SessionKey, not_before: int) -> None:
+        """Move a device's cut-off forward; it never moves back. Call with the lock held."""
+        if not_before > self._not_before.get(key, 0):
+            self._not_before[key] = not_before
+
+    def _prune(self) -> None:
+        """Drop cached sessions past their TTL and cut-offs older than any live token."""
+        now = time.time()
+        max_token_age = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60 * 1000
+        with self._lock:
+            self._sessions = {
+                user_id: cached for user_id, cached in self._sessions.items()
+                if now - cached[0] < self.flush_interval
+            }
+            self._not_before = {
+                key: not_before for key, not_before in self._not_before.items()
+                if _millis(now) - not_before < max_token_age
+            }
+            self._known = {
+                key: known_at for key, known_at in self._known.items()
+                if _millis(now - known_at) < max_token_age
+            }
+
+session_tracker = SessionTracker(flush_interval=settings.SESSION_FLUSH_INTERVAL_SECONDS)
@@ -0,0 +1,31 @@
+import hashlib
+from typing import Dict
+from fastapi import Request, Response, status
+
+def make_etag(content: bytes) -> str:
+    """Strong ETag derived from the exact bytes of a representation."""
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+def make_weak_etag(content: bytes) -> str:
+    """
+    Weak ETag for representations whose bytes can differ while the content
+    is the same (e.g. a CommonResponse whose timestamp changes).
+    """
+    return f"W/{make_etag(content)}"
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag (weak comparison)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {_opaque_tag(candidate.strip()) for candidate in if_none_match.split(",")}
+    return _opaque_tag(etag) in candidates
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """Empty 304 response carrying the validator headers."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
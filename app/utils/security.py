@@ -1,12 +1,22 @@
+import os
+import time
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from typing import Optional
+from functools import lru_cache
+from jose import JWTError, jwk, jwt
+from jose.constants import ALGORITHMS
+from jose.backends.base import Key
+from typing import Dict, Optional, Tuple, Union
 from app.config.settings import settings
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Algorithms signed with a private key and verified with a published public key
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+# Every algorithm ALGORITHM may name; HMAC ones sign with SECRET_KEY
+SIGNING_ALGORITHMS = ALGORITHMS.HMAC | ASYMMETRIC_ALGORITHMS
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -15,6 +25,76 @@ def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
+def is_asymmetric() -> bool:
+    """Whether tokens are signed with a private key (and published via JWKS)."""
+    return settings.ALGORITHM in ASYMMETRIC_ALGORITHMS
+
+@lru_cache(maxsize=1)
+def load_keys() -> Dict[str, Key]:
+    """
+    Load signing and verification keys from JWT_KEYS_DIR.
+
+    Each <kid>.pem file holds one key; private keys can sign, public-only keys
+    are kept to verify tokens from a retired signer until they expire.
+    Raises RuntimeError if ALGORITHM is not a supported signing algorithm.
+    """
+    if settings.ALGORITHM not in SIGNING_ALGORITHMS:
+        raise RuntimeError(
+            f"ALGORITHM {settings.ALGORITHM!r} is not supported; use one of {', '.join(sorted(SIGNING_ALGORITHMS))}"
+        )
+    if not is_asymmetric():
+        return {}
+
+    if not os.path.isdir(settings.JWT_KEYS_DIR):
+        raise RuntimeError(f"JWT_KEYS_DIR {settings.JWT_KEYS_DIR} does not exist")
+
+    keys = {}
+    for file_name in sorted(os.listdir(settings.JWT_KEYS_DIR)):
+        if not file_name.endswith(".pem"):
+            continue
+        with open(os.path.join(settings.JWT_KEYS_DIR, file_name)) as f:
+            keys[file_name[:-len(".pem")]] = jwk.construct(f.read(), settings.ALGORITHM)
+
+    active_key = keys.get(settings.JWT_ACTIVE_KID)
+    if active_key is None or active_key.is_public():
+        raise RuntimeError(
+            f"JWT_ACTIVE_KID {settings.JWT_ACTIVE_KID!r} has no private key in {settings.JWT_KEYS_DIR}"
+        )
+    return keys
+
+@lru_cache(maxsize=1)
+def _verification_keys() -> Dict[str, Key]:
+    """Public keys by kid, derived once from the loaded key files."""
+    return {
+        kid: key if key.is_public() else key.public_key()
+        for kid, key in load_keys().items()
+    }
+
+def get_jwks() -> dict:
+    """JSON Web Key Set with every public key tokens may be verified against."""
+    keys = []
+    for kid, key in _verification_keys().items():
+        jwk_dict = key.to_dict()
+        jwk_dict.update({"kid": kid, "use": "sig", "alg": settings.ALGORITHM})
+        keys.append(jwk_dict)
+    return {"keys": keys}
+
+def _signing_key() -> Tuple[Optional[str], Union[str, Key]]:
+    """Get (kid, key) used to sign new tokens."""
+    if not is_asymmetric():
+        return None, settings.SECRET_KEY
+    return settings.JWT_ACTIVE_KID, load_keys()[settings.JWT_ACTIVE_KID]
+
+def _encode_token(to_encode: dict) -> str:
+    """Sign claims with the active key, tagging the header with its kid."""
+    kid, key = _signing_key()
+    headers = {"kid": kid} if kid else None
+    return jwt.encode(to_encode, key, algorithm=settings.ALGORITHM, headers=headers)
+
+def issued_at() -> float:
+    """Current time for a token's iat, in milliseconds so logouts can be ordered within a second."""
+    return round(time.time(), 3)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -24,8 +104,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    to_encode.setdefault("iat", issued_at())
+    return _encode_token(to_encode)
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT refresh token."""
@@ -36,13 +116,20 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
         expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    to_encode.setdefault("iat", issued_at())
+    return _encode_token(to_encode)
 
 def decode_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        if is_asymmetric():
+            # Select the cached public key by kid; unknown kids are rejected
+            key = _verification_keys().get(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                return None
+        else:
+            key = settings.SECRET_KEY
+        payload = jwt.decode(token, key, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
         return None
@@ -347,6 +347,7 @@ CREATE TABLE busops_user_sessions_tbl (
     platform VARCHAR(50), -- 'ios', 'android', 'web'
     is_active BOOLEAN DEFAULT TRUE,
     last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    tokens_valid_after TIMESTAMP, -- tokens issued to the device before this are rejected
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(user_id, device_id)
 );
@@ -555,6 +556,100 @@ CREATE TRIGGER update_busops_refresh_tokens_updated_at
     BEFORE UPDATE ON busops_refresh_tokens_tbl
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- ====================================================================
+-- TRIGGERS FOR REFERENCE DATA CACHE INVALIDATION
+-- ====================================================================
+
+-- Notify app workers that a reference table changed (payload: table name)
+CREATE OR REPLACE FUNCTION notify_reference_data_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('busops_reference_data', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER notify_busops_depots_change
+    AFTER INSERT OR UPDATE OR DELETE ON busops_depots_tbl
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_reference_data_change();
+
+CREATE TRIGGER notify_busops_vehicles_change
+    AFTER INSERT OR UPDATE OR DELETE ON busops_vehicles_tbl
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_reference_data_change();
+
+CREATE TRIGGER notify_busops_routes_change
+    AFTER INSERT OR UPDATE OR DELETE ON busops_routes_tbl
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_reference_data_change();
+
+CREATE TRIGGER notify_busops_route_stops_change
+    AFTER INSERT OR UPDATE OR DELETE ON busops_route_stops_tbl
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_reference_data_change();
+
+-- ====================================================================
+-- TRIGGERS FOR ATTENDANCE ROSTER INVALIDATION
+-- ====================================================================
+
+-- Notify app workers of each attendance date a statement changed, read
+-- from the statement's transition table, so a bulk upsert of thousands of
+-- rows sends one notification per date. The writing worker tags its
+-- transaction with busops.notify_origin (see AttendanceRepository.bulk_upsert)
+-- and skips the notification it caused, as it has already applied the change.
+CREATE OR REPLACE FUNCTION notify_attendance_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    origin TEXT := NULLIF(current_setting('busops.notify_origin', TRUE), '');
+    changed_date DATE;
+BEGIN
+    FOR changed_date IN SELECT DISTINCT date FROM changed_rows LOOP
+        PERFORM pg_notify('busops_attendance', changed_date::text || COALESCE(':' || origin, ''));
+    END LOOP;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Leave changes can affect any day, so they send a fixed payload
+CREATE OR REPLACE FUNCTION notify_leave_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('busops_attendance', 'leave');
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Staff joining, leaving or moving depot changes every loaded day's rosters
+CREATE OR REPLACE FUNCTION notify_staff_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('busops_attendance', 'staff');
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Transition tables allow one event per trigger; INSERT ... ON CONFLICT DO
+-- UPDATE fires both the insert and the update trigger
+CREATE TRIGGER notify_busops_attendance_insert
+    AFTER INSERT ON busops_attendance_tbl
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_attendance_change();
+
+CREATE TRIGGER notify_busops_attendance_update
+    AFTER UPDATE ON busops_attendance_tbl
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_attendance_change();
+
+CREATE TRIGGER notify_busops_attendance_delete
+    AFTER DELETE ON busops_attendance_tbl
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_attendance_change();
+
+CREATE TRIGGER notify_busops_leave_requests_change
+    AFTER INSERT OR UPDATE OR DELETE ON busops_leave_requests_tbl
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_leave_change();
+
+CREATE TRIGGER notify_busops_staff_change
+    AFTER INSERT OR UPDATE OF depot_id OR DELETE ON busops_staff_tbl
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_staff_change();
+
 -- ====================================================================
 -- SAMPLE DATA INSERTION (FOR TESTING)
 -- ====================================================================
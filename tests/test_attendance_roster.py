@@ -0,0 +1,164 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+from uuid import uuid4
+import pytest
+from app.infra.db.postgres.models.attendance import AttendanceStatus
+from app.services import attendance_roster as attendance_roster_module
+from app.services.attendance_roster import AttendanceRoster, DepotRoster, LEAVE_CHANGED, STAFF_CHANGED, UNMARKED, STATUS_CODES
+
+DEPOT = uuid4()
+STAFF = [uuid4() for _ in range(4)]
+
+
+@pytest.fixture
+def repo():
+    with mock.patch.object(attendance_roster_module, "SessionLocal"), \
+            mock.patch.object(attendance_roster_module, "AttendanceRepository") as repository:
+        repo = repository.return_value
+        repo.list_staff.return_value = [(staff_id, DEPOT) for staff_id in STAFF]
+        repo.get_statuses.return_value = [(STAFF[0], AttendanceStatus.PRESENT)]
+        repo.get_staff_on_leave.return_value = [STAFF[1]]
+        yield repo
+
+
+@pytest.fixture
+def roster(repo):
+    return AttendanceRoster(timezone="Asia/Kolkata", max_days=7)
+
+
+def test_marked_attendance_wins_over_leave_and_unmarked(roster):
+    depot = roster.get(DEPOT, roster.today())
+    assert list(depot.statuses) == [
+        STATUS_CODES[AttendanceStatus.PRESENT], STATUS_CODES[AttendanceStatus.ON_LEAVE], UNMARKED, UNMARKED
+    ]
+    counts = depot.summary()["counts"]
+    assert (counts["present"], counts["on-leave"], counts["unmarked"]) == (1, 1, 2)
+
+
+def test_unknown_depot_is_empty(roster):
+    assert roster.get(uuid4(), roster.today()).summary()["total_staff"] == 0
+
+
+def test_day_older_than_loaded_days_is_returned_not_kept(roster):
+    today = roster.today()
+    for offset in range(7):
+        roster.load_day(today - timedelta(days=offset))
+
+    old_day = today - timedelta(days=30)
+    assert roster.get(DEPOT, old_day).staff_ids == STAFF
+    assert old_day not in roster._days and len(roster._days) == 7
+
+
+def test_apply_updates_in_place_and_invalidates_summary(roster, repo):
+    day = roster.today()
+    before = roster.get(DEPOT, day).summary()
+    roster.apply(DEPOT, day, {STAFF[2]: AttendanceStatus.LATE})
+
+    depot = roster.get(DEPOT, day)
+    assert depot.summary() is not before
+    assert depot.summary()["staff"]["late"] == [STAFF[2]]
+    assert repo.list_staff.call_count == 1
+
+
+def test_apply_with_new_staff_reloads_the_day(roster, repo):
+    day = roster.today()
+    roster.get(DEPOT, day)
+    roster.apply(DEPOT, day, {uuid4(): AttendanceStatus.PRESENT})
+    assert repo.list_staff.call_count == 2
+
+
+def test_own_notification_is_skipped(roster, repo):
+    day = roster.today()
+    roster.get(DEPOT, day)
+    origin = attendance_roster_module.notification_listener.origin
+
+    roster._on_notify({f"{day.isoformat()}:{origin}"})
+    assert repo.list_staff.call_count == 1
+
+    roster._on_notify({f"{day.isoformat()}:other-worker"})
+    roster._on_notify({day.isoformat()})
+    assert repo.list_staff.call_count == 3
+
+
+def test_notification_for_unloaded_day_is_ignored(roster, repo):
+    roster._on_notify({(roster.today() - timedelta(days=3)).isoformat()})
+    repo.list_staff.assert_not_called()
+
+
+def test_leave_change_and_resync_reload_today(roster, repo):
+    roster._on_notify({LEAVE_CHANGED})
+    roster._on_notify(None)
+    assert repo.list_staff.call_count == 2
+
+
+def test_staff_change_reloads_loaded_days(roster, repo):
+    day = roster.today()
+    roster.get(DEPOT, day)
+    moved, other_depot = STAFF[3], uuid4()
+    repo.list_staff.return_value = [(staff_id, DEPOT) for staff_id in STAFF[:3]] + [(moved, other_depot)]
+
+    roster._on_notify({STAFF_CHANGED})
+    assert moved not in roster.get(DEPOT, day).index
+    assert roster.get(other_depot, day).staff_ids == [moved]
+
+
+def test_mark_is_not_lost_to_a_concurrent_reload(roster, repo):
+    day = roster.today()
+    roster.get(DEPOT, day)
+    reading, release = threading.Event(), threading.Event()
+
+    def stale_statuses(_):
+        # The reload read attendance before the mark below committed
+        reading.set()
+        release.wait(5)
+        return [(STAFF[0], AttendanceStatus.PRESENT)]
+
+    repo.get_statuses.side_effect = stale_statuses
+    reload = threading.Thread(target=roster.load_day, args=(day,))
+    reload.start()
+    reading.wait(5)
+    mark = threading.Thread(target=roster.apply, args=(DEPOT, day, {STAFF[2]: AttendanceStatus.LATE}))
+    mark.start()
+    mark.join(0.05)
+    assert mark.is_alive()
+
+    release.set()
+    reload.join()
+    mark.join()
+    assert roster.get(DEPOT, day).statuses[2] == STATUS_CODES[AttendanceStatus.LATE]
+
+
+def test_summary_computed_during_a_mark_is_not_cached():
+    staff_ids = [uuid4(), uuid4()]
+    depot = DepotRoster(staff_ids, bytearray(len(staff_ids)))
+
+    def snapshot_then_mark(statuses):
+        # Another request marks attendance right after this summary copied the statuses
+        copied = bytes(statuses)
+        depot.mark(staff_ids[0], AttendanceStatus.PRESENT)
+        return copied
+
+    with mock.patch.object(attendance_roster_module, "bytes", side_effect=snapshot_then_mark, create=True):
+        assert depot.summary()["counts"]["present"] == 0
+    assert depot.summary()["counts"]["present"] == 1
+
+
+def test_summary_is_consistent_under_concurrent_marks():
+    staff_ids = [uuid4() for _ in range(1000)]
+    depot = DepotRoster(staff_ids, bytearray(len(staff_ids)))
+
+    def mark(chunk):
+        for staff_id in chunk:
+            depot.mark(staff_id, AttendanceStatus.PRESENT)
+            depot.summary()
+
+    threads = [threading.Thread(target=mark, args=(staff_ids[i::8],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = depot.summary()
+    assert summary["counts"]["present"] == len(staff_ids)
+    assert sum(summary["counts"].values()) == summary["total_staff"]
@@ -0,0 +1,43 @@
+from unittest import mock
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from app.api.schemas.auth_schemas import RegisterRequest
+from app.services import auth_service as auth_service_module
+from app.services.auth_service import AuthService
+
+
+@pytest.fixture
+def users():
+    with mock.patch.object(auth_service_module, "UserRepository") as repository:
+        repository.return_value.get_by_email.return_value = None
+        repository.return_value.get_by_phone.return_value = None
+        yield repository.return_value
+
+
+def _request() -> RegisterRequest:
+    return RegisterRequest(
+        email="driver@example.com",
+        phone="9000000000",
+        password="Password123",
+        first_name="Asha",
+        last_name="Patil",
+    )
+
+
+def test_duplicate_checks_read_the_primary(users):
+    db = mock.MagicMock(info={})
+    users.get_by_email.side_effect = lambda email: db.info.get("primary")
+    with pytest.raises(HTTPException) as error:
+        AuthService(db).register(_request())
+    assert error.value.detail == "Email already registered"
+    assert not db.info["primary"]
+
+
+def test_duplicate_inserted_after_the_checks_is_a_400(users):
+    db = mock.MagicMock(info={})
+    users.create.side_effect = IntegrityError("INSERT", {}, Exception("duplicate key"))
+    with pytest.raises(HTTPException) as error:
+        AuthService(db).register(_request())
+    assert error.value.status_code == 400
+    db.rollback.assert_called_once()
@@ -0,0 +1,58 @@
+from unittest import mock
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from app.api import dependencies
+from app.services.session_tracker import SessionTracker
+from app.utils.security import create_access_token, decode_token
+
+
+@pytest.fixture
+def user():
+    return mock.Mock(user_id=uuid4(), status="active")
+
+
+@pytest.fixture
+def tracker(user):
+    tracker = SessionTracker(flush_interval=5)
+    with mock.patch.object(dependencies, "session_tracker", tracker), \
+            mock.patch("app.services.session_tracker.UserSessionRepository") as sessions, \
+            mock.patch.object(dependencies, "UserRepository") as repository:
+        sessions.return_value.get_session.return_value = mock.Mock(is_active=True, tokens_valid_after=None)
+        repository.return_value.get_by_id.return_value = user
+        yield tracker
+
+
+def _payload(user, device_id=None) -> dict:
+    claims = {"sub": str(user.user_id)}
+    if device_id:
+        claims["device_id"] = device_id
+    return decode_token(create_access_token(claims))
+
+
+def test_logged_out_token_is_rejected_without_the_header(user, tracker):
+    payload = _payload(user, "phone-1")
+    assert dependencies.get_current_user(payload, None, None) is user
+
+    tracker.force_logout(None, user.user_id, "phone-1")
+    with pytest.raises(HTTPException) as error:
+        dependencies.get_current_user(payload, None, None)
+    assert error.value.status_code == 401
+
+
+def test_header_naming_another_device_is_rejected(user, tracker):
+    payload = _payload(user, "phone-1")
+    tracker.force_logout(None, user.user_id, "phone-1")
+    with pytest.raises(HTTPException) as error:
+        dependencies.get_current_user(payload, None, "phone-2")
+    assert error.value.detail == "Token was not issued to this device"
+
+
+def test_header_on_a_token_without_a_device_is_rejected(user, tracker):
+    with pytest.raises(HTTPException):
+        dependencies.get_current_user(_payload(user), None, "phone-1")
+
+
+def test_activity_is_recorded_for_the_token_device(user, tracker):
+    dependencies.get_current_user(_payload(user, "phone-1"), None, "phone-1")
+    assert (user.user_id, "phone-1") in tracker._pending
@@ -0,0 +1,47 @@
+from unittest import mock
+import pytest
+from fastapi import status
+from app.utils.http_cache import make_etag, make_weak_etag, is_not_modified, not_modified
+
+
+def _request(if_none_match=None):
+    request = mock.Mock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match is not None else {}
+    return request
+
+
+def test_etag_depends_on_exact_bytes():
+    assert make_etag(b"body") == make_etag(b"body")
+    assert make_etag(b"body") != make_etag(b"body ")
+    assert make_weak_etag(b"body") == f"W/{make_etag(b'body')}"
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("", False),
+    ("*", True),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"other", "abc"', True),
+    ('"other",W/"abc"', True),
+    ('"other"', False),
+    ('"ab"', False),
+])
+def test_is_not_modified_with_strong_etag(header, expected):
+    assert is_not_modified(_request(header), '"abc"') is expected
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('W/"abc"', True),
+    ('"abc"', True),
+    ('W/"other"', False),
+])
+def test_is_not_modified_with_weak_etag(header, expected):
+    assert is_not_modified(_request(header), 'W/"abc"') is expected
+
+
+def test_not_modified_is_empty_with_headers():
+    response = not_modified({"ETag": '"abc"', "Cache-Control": "private, no-cache"})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
@@ -0,0 +1,104 @@
+from dataclasses import replace
+from datetime import timedelta
+from unittest import mock
+from uuid import uuid4
+import pytest
+from app.services import reference_cache as reference_cache_module
+from app.services.reference_cache import ReferenceDataCache, ReferenceTable, DEPOTS, ROUTE_STOPS
+
+
+def _depot(name="Central"):
+    return {
+        "depot_id": uuid4(),
+        "code": "D1",
+        "name": name,
+        "location": "Shivajinagar",
+        "address_line1": "1 Main Road",
+        "city": "Pune",
+        "state": "MH",
+        "pincode": "411005",
+        "contact_number": "9000000000",
+        "capacity": 10,
+    }
+
+
+@pytest.fixture
+def repo():
+    with mock.patch.object(reference_cache_module, "SessionLocal"), \
+            mock.patch.object(reference_cache_module, "ReferenceDataRepository") as repository:
+        yield repository
+
+
+@pytest.fixture
+def depots(repo):
+    rows = [_depot()]
+    with mock.patch.dict(
+        reference_cache_module.TABLES,
+        {DEPOTS: ReferenceTable("Depots", lambda _: list(rows), reference_cache_module.DepotResponse, "depot_id")}
+    ):
+        yield rows
+
+
+def _age(cache: ReferenceDataCache, name: str, seconds: float) -> None:
+    snapshot = cache._snapshots[name]
+    cache._snapshots[name] = replace(snapshot, loaded_at=snapshot.loaded_at - timedelta(seconds=seconds))
+
+
+def test_first_get_loads_and_later_gets_hit(depots):
+    cache = ReferenceDataCache(max_age=300)
+    snapshot = cache.get(DEPOTS)
+    assert snapshot.version == 1 and snapshot.rows == 1
+    assert cache.get(DEPOTS) is snapshot
+    stats = cache.stats()["tables"][DEPOTS]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_expired_snapshot_is_reloaded_on_access(depots):
+    cache = ReferenceDataCache(max_age=300)
+    cache.get(DEPOTS)
+    depots.append(_depot("North"))
+    _age(cache, DEPOTS, 301)
+    snapshot = cache.get(DEPOTS)
+    assert snapshot.version == 2 and snapshot.rows == 2
+
+
+def test_failed_reload_serves_the_stale_snapshot(depots):
+    cache = ReferenceDataCache(max_age=300)
+    stale = cache.get(DEPOTS)
+    _age(cache, DEPOTS, 301)
+    with mock.patch.object(reference_cache_module, "build_snapshot", side_effect=RuntimeError("db down")):
+        assert cache.get(DEPOTS).version == stale.version
+
+
+def test_concurrent_readers_do_not_wait_for_an_expired_reload(depots):
+    cache = ReferenceDataCache(max_age=300)
+    stale = cache.get(DEPOTS)
+    _age(cache, DEPOTS, 301)
+    with cache._load_lock:
+        # Another thread is reloading: readers get the stale snapshot immediately
+        assert cache.get(DEPOTS).version == stale.version
+
+
+def test_etag_is_weak_and_stable_across_reloads(depots):
+    cache = ReferenceDataCache(max_age=300)
+    first = cache.get(DEPOTS)
+    cache.reload([DEPOTS])
+    second = cache.get(DEPOTS)
+    assert first.etag.startswith("W/")
+    assert second.etag == first.etag and second.version == first.version + 1
+
+    depots[0]["name"] = "Renamed"
+    cache.reload([DEPOTS])
+    assert cache.get(DEPOTS).etag != first.etag
+
+
+def test_grouped_table_has_an_empty_entry(repo):
+    with mock.patch.dict(
+        reference_cache_module.TABLES,
+        {ROUTE_STOPS: ReferenceTable(
+            "Route stops", lambda _: [], reference_cache_module.RouteStopResponse, "route_id", grouped=True
+        )}
+    ):
+        snapshot = ReferenceDataCache(max_age=300).get(ROUTE_STOPS)
+    body, etag = snapshot.empty_entry
+    assert b'"data":[]' in body and etag.startswith("W/")
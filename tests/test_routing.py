@@ -0,0 +1,190 @@
+import os
+import time
+from unittest import mock
+import pytest
+from sqlalchemy import column, create_engine, table, text, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.infra.db.postgres.routing import Replica, ReplicaSet, RoutingSession, read_only, use_primary
+
+
+def _sqlite_engine(name: str):
+    """In-memory database holding a single row that names it."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE marker (name TEXT)"))
+        conn.execute(text("INSERT INTO marker VALUES (:name)"), {"name": name})
+    return engine
+
+
+class MarkerRepository:
+    def __init__(self, db):
+        self.db = db
+
+    @read_only
+    def read(self) -> str:
+        return self.db.execute(text("SELECT name FROM marker")).scalar()
+
+    def read_primary(self) -> str:
+        return self.db.execute(text("SELECT name FROM marker")).scalar()
+
+    def write(self) -> None:
+        marker = table("marker", column("name"))
+        self.db.execute(update(marker).values(name=marker.c.name))
+
+
+def _healthy(replica_set: ReplicaSet, lag: float = 0.0) -> ReplicaSet:
+    for replica in replica_set.replicas:
+        replica.lag = lag
+        replica.checked_at = time.time()
+    return replica_set
+
+
+@pytest.fixture
+def no_monitor():
+    """Keep the lag monitor thread from overwriting measurements set by the test."""
+    with mock.patch.object(ReplicaSet, "start") as start:
+        yield start
+
+
+@pytest.fixture
+def routed(no_monitor):
+    primary = _sqlite_engine("primary")
+    replica = _sqlite_engine("replica")
+    replica_set = _healthy(ReplicaSet([replica], max_lag=5, check_interval=5))
+    Session = sessionmaker(class_=RoutingSession, bind=primary)
+
+    def make_session():
+        session = Session()
+        session.replica_set = replica_set
+        return session
+
+    return make_session, replica_set
+
+
+def test_read_only_methods_use_the_replica(routed):
+    make_session, _ = routed
+    repo = MarkerRepository(make_session())
+    assert repo.read() == "replica"
+    assert repo.read_primary() == "primary"
+
+
+def test_reads_after_a_write_use_the_primary(routed):
+    make_session, _ = routed
+    repo = MarkerRepository(make_session())
+    repo.write()
+    assert repo.read() == "primary"
+
+
+def test_use_primary_overrides_read_only(routed):
+    make_session, _ = routed
+    session = make_session()
+    repo = MarkerRepository(session)
+    with use_primary(session):
+        assert repo.read() == "primary"
+    assert repo.read() == "replica"
+
+
+def test_lagging_replica_falls_back_to_the_primary(routed):
+    make_session, replica_set = routed
+    _healthy(replica_set, lag=60)
+    assert MarkerRepository(make_session()).read() == "primary"
+
+
+def test_overdue_lag_check_falls_back_to_the_primary(routed):
+    make_session, replica_set = routed
+    replica_set.replicas[0].checked_at = time.time() - 4 * replica_set.check_interval
+    assert MarkerRepository(make_session()).read() == "primary"
+
+
+def test_unmeasured_replica_is_not_used(no_monitor):
+    replica_set = ReplicaSet([mock.Mock()], max_lag=5, check_interval=5)
+    assert replica_set.choose() is None
+
+
+def test_choose_never_connects_to_a_replica(no_monitor):
+    engine = mock.Mock()
+    replica_set = _healthy(ReplicaSet([engine], max_lag=5, check_interval=5))
+    assert replica_set.choose() is engine
+    engine.connect.assert_not_called()
+    no_monitor.assert_called_once()
+
+
+def test_round_robin_alternates(no_monitor):
+    engines = [mock.Mock(), mock.Mock()]
+    replica_set = _healthy(ReplicaSet(engines, max_lag=5, check_interval=5))
+    assert [replica_set.choose() for _ in range(4)] == engines * 2
+
+
+def test_least_busy_picks_fewest_checked_out(no_monitor):
+    busy, idle = mock.Mock(), mock.Mock()
+    busy.pool.checkedout.return_value = 7
+    idle.pool.checkedout.return_value = 1
+    replica_set = _healthy(ReplicaSet([busy, idle], max_lag=5, check_interval=5, strategy="least_busy"))
+    assert replica_set.choose() is idle
+
+
+def test_monitor_measures_lag_in_the_background():
+    def measure(replica):
+        replica.lag = 0.0
+        replica.checked_at = time.time()
+
+    engine = mock.Mock()
+    replica_set = ReplicaSet([engine], max_lag=5, check_interval=0.01)
+    with mock.patch.object(Replica, "refresh_lag", autospec=True, side_effect=measure):
+        try:
+            replica_set.choose()
+            deadline = time.time() + 2
+            while replica_set.choose() is None and time.time() < deadline:
+                time.sleep(0.01)
+            assert replica_set.choose() is engine
+        finally:
+            replica_set.stop()
+
+
+def test_failed_lag_check_marks_replica_unhealthy():
+    engine = mock.Mock()
+    engine.connect.side_effect = OSError("connection refused")
+    replica = Replica(engine)
+    replica.refresh_lag()
+    assert replica.lag == float("inf")
+    assert replica.checked_at > 0
+
+
+PRIMARY_URL = os.getenv("TEST_PRIMARY_DATABASE_URL")
+REPLICA_URL = os.getenv("TEST_REPLICA_DATABASE_URL")
+
+
+@pytest.mark.skipif(not (PRIMARY_URL and REPLICA_URL), reason="needs two Postgres instances")
+def test_routing_between_two_postgres_instances():
+    primary = create_engine(PRIMARY_URL)
+    replica = create_engine(REPLICA_URL, connect_args={"connect_timeout": 3})
+    replica_set = ReplicaSet([replica], max_lag=5, check_interval=1)
+    replica_set.replicas[0].refresh_lag()
+    session = sessionmaker(class_=RoutingSession, bind=primary)()
+    session.replica_set = replica_set
+
+    class ServerRepository:
+        def __init__(self, db):
+            self.db = db
+
+        @read_only
+        def server(self):
+            return self.db.execute(text("SELECT inet_server_port(), current_database()")).one()
+
+    try:
+        with primary.connect() as conn:
+            primary_server = conn.execute(text("SELECT inet_server_port(), current_database()")).one()
+        with replica.connect() as conn:
+            replica_server = conn.execute(text("SELECT inet_server_port(), current_database()")).one()
+        assert primary_server != replica_server, "point the two URLs at different servers"
+
+        repo = ServerRepository(session)
+        assert repo.server() == replica_server
+        session.execute(text("CREATE TEMP TABLE routing_check (id INT)"))
+        routing_check = table("routing_check", column("id"))
+        session.execute(routing_check.insert().values(id=1))
+        assert repo.server() == primary_server
+    finally:
+        session.close()
+        replica_set.stop()
@@ -0,0 +1,113 @@
+from unittest import mock
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+from app.api.routes import jwks
+from app.config.settings import settings
+from app.utils import security
+from app.utils.security import create_access_token, decode_token, load_keys
+
+PRIVATE_KEYS = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+}
+
+
+def _private_pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def _public_pem(key) -> str:
+    return key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+
+def _clear_caches():
+    load_keys.cache_clear()
+    security._verification_keys.cache_clear()
+    jwks._jwks_document.cache_clear()
+
+
+@pytest.fixture(params=sorted(PRIVATE_KEYS))
+def keys_dir(request, tmp_path):
+    """JWT_KEYS_DIR holding private keys "current" (active) and "next", for RSA and EC."""
+    algorithm = request.param
+    keys = {kid: PRIVATE_KEYS[algorithm]() for kid in ("current", "next")}
+    for kid, key in keys.items():
+        (tmp_path / f"{kid}.pem").write_text(_private_pem(key))
+
+    with mock.patch.object(settings, "ALGORITHM", algorithm), \
+            mock.patch.object(settings, "JWT_KEYS_DIR", str(tmp_path)), \
+            mock.patch.object(settings, "JWT_ACTIVE_KID", "current"):
+        _clear_caches()
+        yield tmp_path, keys
+    _clear_caches()
+
+
+def _signed(key, kid: str) -> str:
+    return jwt.encode({"sub": "user"}, _private_pem(key), algorithm=settings.ALGORITHM, headers={"kid": kid})
+
+
+def test_token_is_verified_with_the_key_its_kid_names(keys_dir):
+    _, keys = keys_dir
+    token = create_access_token({"sub": "user"})
+    assert jwt.get_unverified_header(token)["kid"] == "current"
+    assert decode_token(token)["sub"] == "user"
+
+    assert decode_token(_signed(keys["next"], "next"))["sub"] == "user"
+    # Signed by one key but naming another
+    assert decode_token(_signed(keys["next"], "current")) is None
+
+
+def test_unknown_kid_is_rejected(keys_dir):
+    _, keys = keys_dir
+    assert decode_token(_signed(keys["current"], "retired-long-ago")) is None
+
+
+def test_retired_public_only_key_still_verifies(keys_dir):
+    path, keys = keys_dir
+    token = _signed(keys["next"], "next")
+    (path / "next.pem").write_text(_public_pem(keys["next"]))
+    _clear_caches()
+
+    assert load_keys()["next"].is_public()
+    assert decode_token(token)["sub"] == "user"
+
+
+@pytest.mark.parametrize("active_kid", ["next", "missing"])
+def test_active_kid_without_a_private_key_fails(keys_dir, active_kid):
+    path, keys = keys_dir
+    (path / "next.pem").write_text(_public_pem(keys["next"]))
+    with mock.patch.object(settings, "JWT_ACTIVE_KID", active_kid), pytest.raises(RuntimeError):
+        load_keys()
+
+
+def test_unsupported_algorithm_fails_at_load():
+    load_keys.cache_clear()
+    try:
+        with mock.patch.object(settings, "ALGORITHM", "RS265"), pytest.raises(RuntimeError):
+            load_keys()
+    finally:
+        load_keys.cache_clear()
+
+
+def test_jwks_is_cacheable_and_conditional(keys_dir):
+    app = FastAPI()
+    app.include_router(jwks.router)
+    client = TestClient(app)
+
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}"
+    assert sorted(key["kid"] for key in response.json()["keys"]) == ["current", "next"]
+
+    etag = response.headers["etag"]
+    cached = client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
@@ -0,0 +1,222 @@
+import threading
+import time
+from unittest import mock
+from uuid import uuid4
+import pytest
+from app.services import session_tracker as session_tracker_module
+from app.services.session_tracker import SessionTracker, _millis, _millis_datetime
+from app.utils.security import issued_at
+
+DEVICE = "phone-1"
+
+
+@pytest.fixture
+def repo():
+    with mock.patch.object(session_tracker_module, "UserSessionRepository") as repository:
+        repository.return_value.get_session.return_value = mock.Mock(is_active=True, tokens_valid_after=None)
+        yield repository.return_value
+
+
+@pytest.fixture
+def tracker(repo):
+    return SessionTracker(flush_interval=5)
+
+
+def _later() -> float:
+    """A token iat at least one millisecond after the previous one."""
+    time.sleep(0.002)
+    return issued_at()
+
+
+def test_logout_revokes_tokens_issued_before_it(tracker, repo):
+    user_id = uuid4()
+    login_iat = issued_at()
+    tracker.start_session(None, user_id, DEVICE, login_iat)
+    assert not tracker.is_revoked(None, user_id, DEVICE, login_iat)
+
+    tracker.force_logout(None, user_id, DEVICE)
+    assert tracker.is_revoked(None, user_id, DEVICE, login_iat)
+    repo.deactivate.assert_called_once()
+
+
+def test_token_from_the_same_second_as_the_logout_is_revoked(tracker):
+    user_id = uuid4()
+    token_iat = issued_at()
+    tracker.force_logout(None, user_id, DEVICE)
+    assert tracker.is_revoked(None, user_id, DEVICE, token_iat)
+
+
+def test_login_after_logout_keeps_old_tokens_revoked(tracker):
+    user_id = uuid4()
+    old_iat = issued_at()
+    tracker.start_session(None, user_id, DEVICE, old_iat)
+    tracker.force_logout(None, user_id, DEVICE)
+
+    new_iat = _later()
+    tracker.start_session(None, user_id, DEVICE, new_iat)
+    assert tracker.is_revoked(None, user_id, DEVICE, old_iat)
+    assert not tracker.is_revoked(None, user_id, DEVICE, new_iat)
+
+
+def test_tokens_without_iat_are_revoked_once_a_cut_off_exists(tracker):
+    user_id = uuid4()
+    assert not tracker.is_revoked(None, user_id, DEVICE, None)
+    tracker.force_logout(None, user_id, DEVICE)
+    assert tracker.is_revoked(None, user_id, DEVICE, None)
+
+
+def test_other_devices_are_unaffected(tracker):
+    user_id = uuid4()
+    iat = issued_at()
+    tracker.force_logout(None, user_id, DEVICE)
+    assert not tracker.is_revoked(None, user_id, "tablet-1", iat)
+
+
+def test_flush_batches_activity_into_one_upsert(tracker, repo):
+    users = [uuid4() for _ in range(3)]
+    for user_id in users:
+        tracker.record_activity(user_id, DEVICE)
+        tracker.record_activity(user_id, DEVICE)
+    repo.upsert_activity.return_value = [(user_id, DEVICE, True, None) for user_id in users]
+
+    assert tracker.flush(None) == 3
+    repo.upsert_activity.assert_called_once()
+    assert set(repo.upsert_activity.call_args[0][0]) == {(user_id, DEVICE) for user_id in users}
+    assert tracker.flush(None) == 0
+
+
+def test_flush_adopts_a_logout_from_another_worker(tracker, repo):
+    user_id = uuid4()
+    token_iat = issued_at()
+    logged_out_at = _millis(_later())
+    tracker.record_activity(user_id, DEVICE)
+    repo.upsert_activity.return_value = [(user_id, DEVICE, False, _millis_datetime(logged_out_at))]
+
+    tracker.flush(None)
+    assert tracker.is_revoked(None, user_id, DEVICE, token_iat)
+
+
+def test_flush_accepts_a_relogin_from_another_worker(tracker, repo):
+    user_id = uuid4()
+    old_iat = issued_at()
+    tracker.record_activity(user_id, DEVICE)
+    repo.upsert_activity.return_value = [(user_id, DEVICE, False, _millis_datetime(_millis(_later())))]
+    tracker.flush(None)
+
+    # The device logged back in on another worker before this worker's next flush
+    relogin_iat = _later()
+    tracker.record_activity(user_id, DEVICE)
+    repo.upsert_activity.return_value = [(user_id, DEVICE, True, _millis_datetime(_millis(relogin_iat)))]
+    tracker.flush(None)
+
+    assert not tracker.is_revoked(None, user_id, DEVICE, relogin_iat)
+    assert tracker.is_revoked(None, user_id, DEVICE, old_iat)
+
+
+def test_failed_flush_keeps_pending_activity(tracker, repo):
+    db = mock.Mock()
+    user_id = uuid4()
+    tracker.record_activity(user_id, DEVICE)
+    repo.upsert_activity.side_effect = RuntimeError("database unavailable")
+
+    assert tracker.flush(db) == 0
+    db.rollback.assert_called_once()
+
+    repo.upsert_activity.side_effect = None
+    repo.upsert_activity.return_value = [(user_id, DEVICE, True, None)]
+    assert tracker.flush(db) == 1
+
+
+def test_logout_drops_pending_activity_and_cached_session(tracker, repo):
+    user_id = uuid4()
+    repo.get_active_by_user.return_value = [mock.Mock(device_id=DEVICE, last_activity=None)]
+    tracker.record_activity(user_id, DEVICE)
+    assert DEVICE in tracker.active_sessions(None, user_id)
+
+    tracker.force_logout(None, user_id, DEVICE)
+    assert DEVICE not in tracker.active_sessions(None, user_id)
+    repo.upsert_activity.return_value = []
+    tracker.flush(None)
+    repo.upsert_activity.assert_not_called()
+
+
+def test_concurrent_activity_is_not_lost(tracker, repo):
+    users = [uuid4() for _ in range(50)]
+
+    def record(user_id):
+        for _ in range(100):
+            tracker.record_activity(user_id, DEVICE)
+
+    threads = [threading.Thread(target=record, args=(user_id,)) for user_id in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    repo.upsert_activity.side_effect = lambda pending: [(u, d, True, None) for u, d in pending]
+    assert tracker.flush(None) == len(users)
+
+
+class SharedSessions:
+    """In-memory busops_user_sessions_tbl shared by several workers' trackers."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def get_session(self, user_id, device_id):
+        return self.rows.get((user_id, device_id))
+
+    def activate(self, user_id, device_id, valid_after):
+        row = self.rows.setdefault((user_id, device_id), mock.Mock(tokens_valid_after=None))
+        row.is_active = True
+        row.tokens_valid_after = max(filter(None, [row.tokens_valid_after, valid_after]))
+
+    def deactivate(self, user_id, device_id, revoked_at):
+        row = self.rows.get((user_id, device_id))
+        if row is None or not row.is_active:
+            return False
+        row.is_active = False
+        row.tokens_valid_after = max(row.tokens_valid_after, revoked_at)
+        return True
+
+
+@pytest.fixture
+def shared():
+    sessions = SharedSessions()
+    with mock.patch.object(session_tracker_module, "UserSessionRepository", lambda db: sessions):
+        yield sessions
+
+
+def test_logout_on_one_worker_is_seen_by_a_fresh_worker(shared):
+    user_id = uuid4()
+    login_iat = issued_at()
+    SessionTracker(flush_interval=5).start_session(None, user_id, DEVICE, login_iat)
+    SessionTracker(flush_interval=5).force_logout(None, user_id, DEVICE)
+
+    # A worker started after the logout has nothing in memory for the device
+    restarted = SessionTracker(flush_interval=5)
+    assert restarted.is_revoked(None, user_id, DEVICE, login_iat)
+    assert restarted.is_revoked(None, user_id, DEVICE, login_iat, refresh=True)
+
+
+def test_refresh_reads_a_logout_the_worker_already_cached_past(shared):
+    user_id = uuid4()
+    login_iat = issued_at()
+    worker, other = SessionTracker(flush_interval=5), SessionTracker(flush_interval=5)
+    worker.start_session(None, user_id, DEVICE, login_iat)
+    assert not worker.is_revoked(None, user_id, DEVICE, login_iat)
+
+    other.force_logout(None, user_id, DEVICE)
+    # Access tokens wait for the next flush; refreshes check the database
+    assert worker.is_revoked(None, user_id, DEVICE, login_iat, refresh=True)
+    assert worker.is_revoked(None, user_id, DEVICE, login_iat)
+
+
+def test_device_without_a_session_row_is_revoked(shared):
+    assert SessionTracker(flush_interval=5).is_revoked(None, uuid4(), DEVICE, issued_at())
+
+
+def test_legacy_logout_without_a_cut_off_is_revoked(shared):
+    user_id = uuid4()
+    shared.rows[(user_id, DEVICE)] = mock.Mock(is_active=False, tokens_valid_after=None)
+    assert SessionTracker(flush_interval=5).is_revoked(None, user_id, DEVICE, issued_at())